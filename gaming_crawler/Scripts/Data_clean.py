@@ -6,6 +6,25 @@ from datetime import datetime
 # ==========================================
 # UTF-8 RECOVERY + CLEANING FUNCTION
 # ==========================================
+# Common mojibake sequences. Longer sequences sharing a prefix come first so
+# the alternation below prefers them, as the old sequential subs did.
+MOJIBAKE = {
+    "â€™": "'",
+    "â€˜": "'",
+    "â€œ": '"',
+    "â€\x9d": '"',
+    "â€": "—",
+    "â„¢": "™",
+    "Â®": "®",
+    "Â©": "©",
+    "Â ": " ",
+    "Â": "",
+}
+# One pass over each cell instead of one re.sub per pattern
+MOJIBAKE_RE = re.compile("|".join(map(re.escape, MOJIBAKE)))
+CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F]")
+SPACES_RE = re.compile(r"[ \t]+")
+
 def fix_encoding(text):
     if not isinstance(text, str):
         return text
@@ -17,28 +36,13 @@ def fix_encoding(text):
     text = unicodedata.normalize("NFKC", text)
 
     # Step 2: Regex cleanup of common mojibake patterns
-    replacements = {
-        r"â€™": "'",
-        r"â€˜": "'",
-        r"â€œ": '"',
-        r"â€\x9d": '"',
-        r"â€": "–",
-        r"â€": "—",
-        r"â„¢": "™",
-        r"Â®": "®",
-        r"Â©": "©",
-        r"Â ": " ",
-        r"Â": "",
-    }
-
-    for pattern, repl in replacements.items():
-        text = re.sub(pattern, repl, text)
+    text = MOJIBAKE_RE.sub(lambda m: MOJIBAKE[m.group()], text)
 
     # Step 3: Remove control chars (but keep newlines if needed)
-    text = re.sub(r"[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F]", "", text)
+    text = CONTROL_CHARS_RE.sub("", text)
 
     # Step 4: Normalize whitespace
-    text = re.sub(r"[ \t]+", " ", text).strip()
+    text = SPACES_RE.sub(" ", text).strip()
 
     return text
 
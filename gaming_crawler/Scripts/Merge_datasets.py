@@ -3,6 +3,27 @@ import re
 import numpy as np
 from datetime import datetime
 
+# Applied to every row of every dataset - compiled once
+HTML_ENTITY_RE = re.compile(r'&nbsp;|&amp;|&lt;|&gt;|&quot;')
+UNICODE_SPACE_RE = re.compile(r'[\u00a0\u200b\xa0]')
+ESCAPED_WS_RE = re.compile(r'\\[nrt]')
+WHITESPACE_RE = re.compile(r'\s+')
+CURRENCY_RE = re.compile(r'[€$£¥]')
+NUMBER_RE = re.compile(r'\d+\.?\d*')
+YEAR_ONLY_RE = re.compile(r'^\d{4}$')
+GENRE_SPLIT_RE = re.compile(r'[,;|]')
+
+# (strptime format, shape it applies to)
+DATE_FORMATS = [
+    ('%d-%b-%y', re.compile(r'^\d{1,2}-[A-Za-z]{3}-\d{2}$')),          # 30-Oct-25
+    ('%B %d, %Y', re.compile(r'^[A-Za-z]+\s+\d{1,2},\s+\d{4}$')),      # October 30, 2025
+    ('%d-%b-%Y', re.compile(r'^\d{1,2}-[A-Za-z]{3}-\d{4}$')),          # 30-Oct-2025
+    ('%Y-%m-%d', re.compile(r'^\d{4}-\d{2}-\d{2}$')),                  # 2025-10-30
+    ('%d %b, %Y', re.compile(r'^\d{1,2}\s+[A-Za-z]{3},\s+\d{4}$')),    # 30 Oct, 2025
+    ('%b %d, %Y', re.compile(r'^[A-Za-z]{3}\s+\d{1,2},\s+\d{4}$')),    # Oct 30, 2025
+    ('%d-%m-%Y', re.compile(r'^\d{1,2}-\d{2}-\d{4}$')),                # 30-10-2025
+]
+
 def load_csv_safely(filepath, encoding='utf-8'):
     """Load CSV with fallback encoding"""
     try:
@@ -24,12 +45,12 @@ def clean_text(text):
         return None
     
     # Remove HTML entities and Unicode artifacts
-    text = re.sub(r'&nbsp;|&amp;|&lt;|&gt;|&quot;', ' ', text)
-    text = re.sub(r'[\u00a0\u200b\xa0]', ' ', text)
-    text = re.sub(r'\\[nrt]', ' ', text)
+    text = HTML_ENTITY_RE.sub(' ', text)
+    text = UNICODE_SPACE_RE.sub(' ', text)
+    text = ESCAPED_WS_RE.sub(' ', text)
     
     # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = WHITESPACE_RE.sub(' ', text).strip()
     
     return text if text else None
 
@@ -64,7 +85,7 @@ def normalize_price(price_value):
         return 0.0
     
     # Remove currency symbols
-    price_str = re.sub(r'[€$£¥]', '', price_str).strip()
+    price_str = CURRENCY_RE.sub('', price_str).strip()
     
     # Handle European format (comma as decimal)
     if ',' in price_str and '.' not in price_str:
@@ -74,7 +95,7 @@ def normalize_price(price_value):
         price_str = price_str.replace('.', '').replace(',', '.')
     
     # Extract first numeric value
-    match = re.search(r'\d+\.?\d*', price_str)
+    match = NUMBER_RE.search(price_str)
     if match:
         return float(match.group())
     
@@ -88,25 +109,15 @@ def normalize_date(date_value):
     date_str = str(date_value).strip()
     
     # Try multiple date formats
-    formats = [
-        ('%d-%b-%y', r'^\d{1,2}-[A-Za-z]{3}-\d{2}$'),          # 30-Oct-25
-        ('%B %d, %Y', r'^[A-Za-z]+\s+\d{1,2},\s+\d{4}$'),      # October 30, 2025
-        ('%d-%b-%Y', r'^\d{1,2}-[A-Za-z]{3}-\d{4}$'),          # 30-Oct-2025
-        ('%Y-%m-%d', r'^\d{4}-\d{2}-\d{2}$'),                  # 2025-10-30
-        ('%d %b, %Y', r'^\d{1,2}\s+[A-Za-z]{3},\s+\d{4}$'),    # 30 Oct, 2025
-        ('%b %d, %Y', r'^[A-Za-z]{3}\s+\d{1,2},\s+\d{4}$'),    # Oct 30, 2025
-        ('%d-%m-%Y', r'^\d{1,2}-\d{2}-\d{4}$'),                # 30-10-2025
-    ]
-    
-    for fmt, pattern in formats:
-        if re.match(pattern, date_str):
+    for fmt, pattern in DATE_FORMATS:
+        if pattern.match(date_str):
             try:
                 return datetime.strptime(date_str, fmt).strftime('%Y-%m-%d')
             except ValueError:
                 continue
     
     # Handle year-only format
-    if re.match(r'^\d{4}$', date_str):
+    if YEAR_ONLY_RE.match(date_str):
         return f"{date_str}-01-01"
     
     return None
@@ -117,7 +128,7 @@ def extract_genres(genres_value):
         return None
     
     # Split by common delimiters
-    genres = re.split(r'[,;|]', str(genres_value))
+    genres = GENRE_SPLIT_RE.split(str(genres_value))
     cleaned = []
     
     for g in genres:
@@ -331,10 +342,9 @@ def generate_quality_report(df):
     print("="*70)
     print(f"\nTotal unique games: {len(df)}")
     
-    # Source breakdown
+    # Source breakdown - one counting pass instead of a boolean mask per source
     print("\nGames by source:")
-    for source in df['data_source'].unique():
-        count = len(df[df['data_source'] == source])
+    for source, count in df['data_source'].value_counts(sort=False).items():
         pct = (count / len(df)) * 100
         print(f"   {source}: {count} ({pct:.1f}%)")
     
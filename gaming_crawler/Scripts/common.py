@@ -0,0 +1,118 @@
+"""
+Helpers shared by the Steam, GOG and Instant Gaming scrapers:
+browser launch settings, the HTTP session and media file writing.
+"""
+
+import os, re, time, shutil, asyncio
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Resolve the Chromium binary once; None lets Playwright use its bundled build
+CHROMIUM_PATH = os.environ.get("CHROMIUM_PATH") or None
+CHROMIUM_ARGS = [
+    '--disable-blink-features=AutomationControlled', '--disable-dev-shm-usage',
+    # Skip background services every new browser would otherwise start
+    '--disable-extensions', '--disable-background-networking', '--disable-sync',
+    '--disable-translate', '--metrics-recording-only', '--disable-default-apps',
+    '--no-first-run', '--no-default-browser-check', '--disable-component-update',
+    '--disable-features=OptimizationHints,Translate',
+    # Every scraper reads image URLs from the DOM and never the pixels; with images
+    # off the renderer never requests them, so they don't round-trip through a route handler
+    '--blink-settings=imagesEnabled=false',
+]
+
+# Resource types the scrapers never render - media URLs are read from the DOM
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "stylesheet", "font", "media"})
+
+# Third-party analytics/ad hosts; each one costs a DNS + TLS handshake per page
+TRACKER_URL_RE = re.compile(
+    r'^https?://[^/]*\b(?:doubleclick\.net|google-analytics\.com|googletagmanager\.com|'
+    r'googlesyndication\.com|facebook\.net|hotjar\.com|scorecardresearch\.com|'
+    r'taboola\.com|optimizely\.com|criteo\.(?:com|net)|segment\.(?:io|com)|braze\.com|'
+    r'amplitude\.com|newrelic\.com|nr-data\.net|clarity\.ms|quantserve\.com)/'
+)
+
+# Requests served by a service worker bypass context.route, so contexts that
+# block anything are created with service_workers=SERVICE_WORKERS
+SERVICE_WORKERS = "block"
+
+async def block_heavy_resources(route):
+    """Async Playwright route handler that aborts images, CSS, fonts, media and trackers"""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES or TRACKER_URL_RE.match(route.request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+class RateLimiter:
+    """Spaces async page loads at least `interval` seconds apart, shared by every caller.
+    Time already spent loading/parsing counts toward the interval.
+    
+    Each caller books the next free slot before awaiting anything, so on a
+    single event loop no lock is needed and waiters don't queue behind a sleeper."""
+    def __init__(self, interval):
+        self.interval = interval
+        self.next_slot = 0.0
+    
+    async def acquire(self):
+        now = time.monotonic()
+        slot = max(now, self.next_slot)
+        self.next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+# One session for every media download so connections are reused.
+# The pool is sized for concurrent downloads hitting the same few CDN hosts.
+SESSION = requests.Session()
+SESSION.headers['User-Agent'] = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+_ADAPTER = HTTPAdapter(pool_connections=16, pool_maxsize=32,
+                       max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504)))
+SESSION.mount('http://', _ADAPTER)
+SESSION.mount('https://', _ADAPTER)
+
+# Async scrapers hand blocking downloads to this pool rather than asyncio's default
+# executor (min(32, CPUs + 4) threads, shared with every other to_thread call), so as
+# many transfers can be in flight as SESSION keeps connections. Threads start lazily.
+MEDIA_POOL = ThreadPoolExecutor(max_workers=32, thread_name_prefix="media")
+
+async def run_download(fn, *args):
+    """Await a blocking download call on MEDIA_POOL"""
+    return await asyncio.get_running_loop().run_in_executor(MEDIA_POOL, fn, *args)
+
+# Small JSON API calls multiplex over one HTTP/2 connection when httpx[http2] is
+# installed; otherwise they share SESSION. Both expose .get(url, params=, timeout=).
+try:
+    import httpx
+    API = httpx.Client(http2=True, headers={'User-Agent': SESSION.headers['User-Agent']},
+                       limits=httpx.Limits(max_connections=32, max_keepalive_connections=16))
+except ImportError:  # httpx or its h2 extra missing
+    API = SESSION
+
+# Characters Windows rejects in file names, plus control characters
+SAFE_NAME_RE = re.compile(r'[<>:"/\\|?*\x00-\x1F]')
+
+def safe_dirname(title, maxlen=50):
+    """Media folder name for a game title"""
+    return SAFE_NAME_RE.sub('', title)[:maxlen].strip()
+
+IMAGE_EXT_RE = re.compile(r'\.(jpe?g|png|webp)(?:\?|$)', re.IGNORECASE)
+
+def image_ext(url, default="jpg"):
+    """File extension for an image URL, e.g. 'png' for '.../a.PNG?x=1'"""
+    m = IMAGE_EXT_RE.search(url)
+    return m.group(1).lower() if m else default
+
+# Trailers run to tens of MB; large chunks keep the write loop short.
+# Images are a few hundred KB, so a smaller buffer per concurrent download will do.
+MEDIA_CHUNK_SIZE = 1 << 20
+IMAGE_CHUNK_SIZE = 1 << 16
+VIDEO_EXTS = ('.mp4', '.webm')
+
+def save_stream(response, filepath):
+    """Write a streamed requests response to disk straight from the raw socket"""
+    response.raw.decode_content = True  # still undo gzip/deflate transfer encoding
+    chunk_size = MEDIA_CHUNK_SIZE if filepath.lower().endswith(VIDEO_EXTS) else IMAGE_CHUNK_SIZE
+    with open(filepath, 'wb') as f:
+        shutil.copyfileobj(response.raw, f, length=chunk_size)
+    return filepath
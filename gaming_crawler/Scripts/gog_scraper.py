@@ -4,169 +4,297 @@ GOG Scraper v3.0 - Complete Fixed Version
 Properly extracts: ratings, review counts, descriptions, genres, publishers, dates, and all media
 """
 
-import os, re, time, random, asyncio
+import os, re, csv, time, asyncio, weakref
 from pathlib import Path
-import requests
-import pandas as pd
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
+from common import CHROMIUM_PATH, CHROMIUM_ARGS, SERVICE_WORKERS, API, SESSION, save_stream, safe_dirname, run_download, RateLimiter, TRACKER_URL_RE
 
 CFG = {
     'workers': 3,
     'headless': True,
     'page_timeout': 30000,
-    'wait_after_load': 2000,
     'max_screenshots': 10,
     'max_videos': 5,
     'download_media': True,
+    'min_request_interval': 0.5,  # seconds between navigations, across all workers
+    'media_concurrency': 16,      # parallel media downloads, across all workers
 }
 
-def log(msg): print(f"[{time.strftime('%H:%M:%S')}] {msg}")
+# Compiled once - these run for every tile / product page
+DISCOUNT_RE = re.compile(r'-(\d+)%')
+PRICE_RE = re.compile(r'[€$£¥]\s*[\d,]+\.?\d*')
+NUMBER_RE = re.compile(r'([\d.]+)')
+REVIEW_COUNT_RE = re.compile(r'(\d+)\s*Review')
+TRAILING_DOTS_RE = re.compile(r'\.\.\.+$')
+WHITESPACE_RE = re.compile(r'\s+')
+THUMB_SIZE_RE = re.compile(r'([_-])(256|512|thumb)\.')
+VIDEO_FILE_RE = re.compile(r'\.(?:mp4|webm)', re.IGNORECASE)
+DLC_BADGE_RE = re.compile(r'DLC|MICRO ?TRANSACTION|ADD-ON|EXPANSION', re.IGNORECASE)
+STATUS_BADGE_RE = re.compile(r'SOON|PRE-ORDER|MOD|COMING', re.IGNORECASE)
+DLC_TITLE_RE = re.compile(r'DLC|EXPANSION PACK|SEASON PASS|MICRO ?TRANSACTION|ADD-ON|'
+                          r'CONTENT PACK|BONUS CONTENT|DELUXE UPGRADE', re.IGNORECASE)
+
+LIMITER = RateLimiter(CFG['min_request_interval'])  # navigations, across all workers
+MEDIA_SLOTS = asyncio.Semaphore(CFG['media_concurrency'])
+
+COOKIE_BUTTON = "button.cookie-consent__accept, #onetrust-accept-btn-handler"
+CONSENTED = weakref.WeakSet()  # contexts whose consent cookie is already set
+
+async def accept_cookies(page):
+    """Dismiss the consent banner. Once accepted the cookie covers every page in the
+    context, so later pages skip the check entirely."""
+    if page.context in CONSENTED:
+        return
+    try:
+        cookie_btn = page.locator(COOKIE_BUTTON).first
+        if await cookie_btn.is_visible():
+            await cookie_btn.click()
+            CONSENTED.add(page.context)
+    except: pass
 
-def sanitize(name, maxlen=80):
-    return re.sub(r'[<>:"/\\|?*\x00-\x1F]', '', name).strip()[:maxlen]
+def log(msg): print(f"[{time.strftime('%H:%M:%S')}] {msg}")
 
 def parse_price(txt):
     if not txt: return "N/A", "N/A", "N/A"
     txt = txt.strip()
     if 'free' in txt.lower(): return "Free", "N/A", "N/A"
-    disc = re.search(r'-(\d+)%', txt)
-    prices = re.findall(r'[€$£¥]\s*[\d,]+\.?\d*', txt)
+    disc = DISCOUNT_RE.search(txt)
+    prices = PRICE_RE.findall(txt)
     return (prices[0].strip() if prices else "N/A",
             prices[1].strip() if len(prices) > 1 else "N/A",
             disc.group(1) + "%" if disc else "N/A")
 
+OUT_FILE = Path("scraped_data") / "gog_games_complete.csv"
+COLS_ORDER = ['title', 'url', 'price', 'original_price', 'discount_percentage', 
+              'rating', 'rating_count', 'release_date', 'genres', 'platforms', 
+              'developer', 'publisher', 'description', 'status_tag',
+              'screenshots', 'videos', 'header_image', 
+              'downloaded_images', 'downloaded_videos']
+
+def claim(sink, url):
+    """Reserve a URL for detail scraping; False if another worker already has it"""
+    if url in sink['claimed']:
+        return False
+    sink['claimed'].add(url)
+    return True
+
+def write_row(sink, game):
+    """Append one game to the output CSV unless its URL was already written"""
+    url = game.get('url')
+    if url in sink['seen']:
+        return False
+    sink['seen'].add(url)
+    sink['writer'].writerow({k: ", ".join(v) if isinstance(v, list) else v for k, v in game.items()})
+    return True
+
 def download_file(url, path, timeout=20):
-    if not url or url == "N/A" or os.path.exists(path):
-        return path if os.path.exists(path) else None
+    """Fetch url to path; the caller creates the game's folder first"""
+    if not url or url == "N/A":
+        return None
+    if os.path.exists(path):
+        return path
     try:
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-        r = requests.get(url, stream=True, timeout=timeout, headers=headers)
-        if r.status_code == 200:
-            with open(path, 'wb') as f:
-                for chunk in r.iter_content(8192):
-                    f.write(chunk)
-            return path
+        with SESSION.get(url, stream=True, timeout=timeout) as r:
+            if r.status_code == 200:
+                return save_stream(r, path)
     except: pass
     return None
 
+# Steps through the page in-browser (one round-trip), then returns to the top.
+# Each step waits two frames (enough for IntersectionObserver lazy-loaders), then
+# the DOM is given until it is quiet for 100ms, capped at settle ms.
+# Args: [step px, max depth px, settle cap ms]
+SCROLL_JS = """
+async ([step, maxY, settle]) => {
+    const frames = () => new Promise(r => requestAnimationFrame(() => requestAnimationFrame(r)));
+    for (let y = 0; y <= Math.min(maxY, document.body.scrollHeight); y += step) {
+        window.scrollTo(0, y);
+        await frames();
+    }
+    await new Promise(resolve => {
+        let quiet, cap;
+        const done = () => { observer.disconnect(); clearTimeout(quiet); clearTimeout(cap); resolve(); };
+        const observer = new MutationObserver(() => { clearTimeout(quiet); quiet = setTimeout(done, 100); });
+        observer.observe(document.body, {childList: true, subtree: true, attributes: true});
+        quiet = setTimeout(done, 100);
+        cap = setTimeout(done, settle);
+    });
+    window.scrollTo(0, 0);
+}
+"""
+
+# Jumps to the bottom until the catalog's product-link count stops growing, checking
+# every 150ms, capped at cap ms - returns as soon as the listing is complete instead
+# of stepping through the page and waiting out unrelated DOM churn.
+# Args: [link selector, cap ms]
+TILES_SETTLED_JS = """
+async ([sel, cap]) => {
+    const end = Date.now() + cap;
+    let prev = -1, n = document.querySelectorAll(sel).length;
+    while (n !== prev && Date.now() < end) {
+        prev = n;
+        window.scrollTo(0, document.body.scrollHeight);
+        await new Promise(r => setTimeout(r, 150));
+        n = document.querySelectorAll(sel).length;
+    }
+    window.scrollTo(0, 0);
+    return n;
+}
+"""
+GAME_LINK_SELECTOR = "a[href*='/game/']"
+
+# href, badge, title, aria-label and price text for every catalog tile.
+# Tiles are matched by their own class so nav/footer /game/ links and tile
+# sub-elements (product-tile__title etc.) are never visited.
+LIST_CARDS_JS = r"""
+() => {
+    let cards = document.querySelectorAll("a[class*='product-tile'][href*='/game/'], a[class*='game-card'][href*='/game/']");
+    if (!cards.length) cards = document.querySelectorAll("a[href*='/game/']");
+    // Only canonical product URLs; nav/genre/filter links never reach Python
+    const GAME_URL = /^https:\/\/www\.gog\.com\/(?:[a-z]{2}\/)?game\/[a-z0-9_]+\/?$/i;
+    return Array.from(cards).filter(card => GAME_URL.test(card.href)).map(card => {
+        const text = sel => { const e = card.querySelector(sel); return e ? e.textContent : null; };
+        return {
+            href: card.href,
+            badge: text("[class*='badge'], [class*='label'], [class*='tag']"),
+            title: text(".product-title, [class*='title'], h3, h2"),
+            aria: card.getAttribute("aria-label"),
+            price: text("[class*='price'], .price-value")
+        };
+    });
+}
+"""
+
+# GOG's catalog JSON: the same listing as the store page, already structured
+CATALOG_API = "https://catalog.gog.com/v1/catalog"
+OS_NAMES = {"windows": "Windows", "osx": "Mac", "linux": "Linux"}
+
+def fetch_catalog_page(page_num):
+    """One catalog page from the JSON API as scrape_list_page rows, plus the product
+    fields the API already carries (the product page fills in the rest).
+    Raises on HTTP or JSON errors."""
+    r = API.get(CATALOG_API, params={
+        "limit": 48, "page": page_num, "order": "desc:releaseDate", "productType": "in:game,pack",
+        "countryCode": "US", "locale": "en-US", "currencyCode": "USD"
+    }, timeout=15)
+    r.raise_for_status()
+    
+    games = []
+    for product in r.json().get("products", []):
+        title = (product.get("title") or "").strip()
+        url = product.get("storeLink")
+        if not title or not url or DLC_TITLE_RE.search(title):
+            continue
+        
+        state = product.get("productState") or "default"
+        status_tag = state.replace('-', ' ').upper() if state != "default" else ""
+        if status_tag:
+            title = f"{status_tag}   {title}"
+        
+        price = product.get("price") or {}
+        if (price.get("finalMoney") or {}).get("amount") in ("0", "0.00"):
+            current, orig, disc = "Free", "N/A", "N/A"
+        else:
+            disc = DISCOUNT_RE.search(price.get("discount") or "")
+            current = price.get("final") or "N/A"
+            orig = (price.get("base") or "N/A") if disc else "N/A"
+            disc = disc.group(1) + "%" if disc else "N/A"
+        
+        rating = product.get("reviewsRating")  # 0-50
+        release = product.get("releaseDate") or ""
+        platforms = [OS_NAMES[o] for o in product.get("operatingSystems") or [] if o in OS_NAMES]
+        games.append({
+            "title": title, "url": url, "price": current, "original_price": orig,
+            "discount_percentage": disc, "status_tag": status_tag,
+            "rating": f"{rating / 10:.1f}" if rating else "N/A",
+            "release_date": release.replace('.', '-') if release else "N/A",
+            "genres": ", ".join(g["name"] for g in product.get("genres") or [] if g.get("name")) or "N/A",
+            "platforms": ", ".join(platforms) or "N/A",
+            "developer": (product.get("developers") or ["N/A"])[0],
+            "publisher": (product.get("publishers") or ["N/A"])[0],
+            "header_image": product.get("coverHorizontal") or "N/A",
+            # Screenshot URLs are templates; without the size suffix they are full size
+            "screenshots": [u.replace("_{formatter}", "") for u in product.get("screenshots") or []][:CFG['max_screenshots']],
+        })
+    return games
+
 async def scrape_list_page(page, page_num, wid):
-    """Scrape game list from a catalog page"""
+    """Game list for a catalog page: the JSON API, or the rendered page if that fails"""
+    try:
+        await LIMITER.acquire()
+        games = await asyncio.to_thread(fetch_catalog_page, page_num)
+        if games:
+            log(f"W{wid} → Page {page_num}: Found {len(games)} games (API)")
+            return games
+    except Exception as e:
+        log(f"W{wid} → Page {page_num}: catalog API failed ({str(e)[:40]}), loading the page")
+    
     try:
         url = f"https://www.gog.com/en/games?order=desc:releaseDate&page={page_num}"
         log(f"W{wid} → Page {page_num}")
         
+        await LIMITER.acquire()
         await page.goto(url, wait_until="domcontentloaded", timeout=CFG['page_timeout'])
         
         # Handle cookies
-        try:
-            cookie_btn = page.locator("button.cookie-consent__accept, #onetrust-accept-btn-handler").first
-            if await cookie_btn.is_visible(timeout=2000):
-                await cookie_btn.click()
-                await page.wait_for_timeout(500)
-        except: pass
+        await accept_cookies(page)
         
         # Wait for games to load
-        await page.wait_for_selector("a[href*='/game/']", timeout=15000)
-        await page.wait_for_timeout(CFG['wait_after_load'])
+        await page.wait_for_selector(GAME_LINK_SELECTOR, timeout=15000)
         
-        # Scroll to load lazy content
-        for i in range(6):
-            await page.evaluate(f"window.scrollTo(0, {i * 900})")
-            await page.wait_for_timeout(400)
+        # Scroll until no more tiles appear
+        await page.evaluate(TILES_SETTLED_JS, [GAME_LINK_SELECTOR, 1500])
         
-        await page.evaluate("window.scrollTo(0, 0)")
-        await page.wait_for_timeout(500)
-        
-        # Get all game cards
-        game_cards = await page.locator("[class*='product-tile'], [class*='game-card'], a[href*='/game/']").all()
+        # Get all game cards - every field in one round-trip
+        game_cards = await page.evaluate(LIST_CARDS_JS)
         
         games = []
         seen_urls = set()
         
         for card in game_cards:
-            try:
-                # Get URL
-                href = await card.get_attribute("href")
-                if not href or '/game/' not in href:
-                    continue
-                
-                url = href if href.startswith("http") else f"https://www.gog.com{href}"
-                
-                if url in seen_urls:
-                    continue
-                seen_urls.add(url)
-                
-                # Extract status tag and filter out DLCs/Microtransactions
-                status_tag = ""
-                should_skip = False
-                try:
-                    badge = card.locator("[class*='badge'], [class*='label'], [class*='tag']").first
-                    status_text = await badge.text_content(timeout=500)
-                    if status_text:
-                        status_text = status_text.strip().upper()
-                        
-                        # Skip DLCs and microtransactions
-                        if any(x in status_text for x in ['DLC', 'MICROTRANSACTION', 'MICRO TRANSACTION', 'ADD-ON', 'EXPANSION']):
-                            should_skip = True
-                        
-                        if any(x in status_text for x in ['SOON', 'PRE-ORDER', 'MOD', 'COMING']):
-                            status_tag = status_text
-                except: pass
-                
-                # Skip this game if it's a DLC or microtransaction
-                if should_skip:
+            # Absolute, already validated in LIST_CARDS_JS
+            url = card["href"]
+            
+            if url in seen_urls:
+                continue
+            seen_urls.add(url)
+            
+            # Extract status tag and filter out DLCs/Microtransactions
+            status_tag = ""
+            status_text = (card["badge"] or "").strip().upper()
+            if status_text:
+                # Skip DLCs and microtransactions
+                if DLC_BADGE_RE.search(status_text):
                     continue
                 
-                # Extract title and check for DLC keywords
-                title = None
-                try:
-                    title_elem = card.locator(".product-title, [class*='title'], h3, h2").first
-                    title = await title_elem.text_content(timeout=500)
-                    title = title.strip() if title else None
-                except: pass
-                
-                if not title:
-                    try:
-                        title = await card.get_attribute("aria-label")
-                    except: pass
-                
-                if not title:
-                    game_slug = url.split('/game/')[-1].strip('/')
-                    title = game_slug.replace('_', ' ').replace('-', ' ').title()
-                
-                # Skip if title contains DLC indicators
-                if title:
-                    title_upper = title.upper()
-                    dlc_keywords = ['DLC', ' - DLC', 'EXPANSION PACK', 'SEASON PASS', 
-                                    'MICRO TRANSACTION', 'MICROTRANSACTION', 'ADD-ON',
-                                    'CONTENT PACK', 'BONUS CONTENT', 'DELUXE UPGRADE']
-                    
-                    if any(keyword in title_upper for keyword in dlc_keywords):
-                        continue
-                
-                if status_tag and not title.startswith(status_tag):
-                    title = f"{status_tag}   {title}"
-                
-                # Extract price
-                price, orig, disc = "N/A", "N/A", "N/A"
-                try:
-                    price_elem = card.locator("[class*='price'], .price-value").first
-                    price_text = await price_elem.text_content(timeout=500)
-                    price, orig, disc = parse_price(price_text)
-                except: pass
-                
-                games.append({
-                    "title": title,
-                    "url": url,
-                    "price": price,
-                    "original_price": orig,
-                    "discount_percentage": disc,
-                    "status_tag": status_tag
-                })
-                
-            except Exception as e:
+                if STATUS_BADGE_RE.search(status_text):
+                    status_tag = status_text
+            
+            # Extract title and check for DLC keywords
+            title = (card["title"] or "").strip() or card["aria"]
+            
+            if not title:
+                game_slug = url.split('/game/')[-1].strip('/')
+                title = game_slug.replace('_', ' ').replace('-', ' ').title()
+            
+            # Skip if title contains DLC indicators
+            if DLC_TITLE_RE.search(title):
                 continue
+            
+            if status_tag and not title.startswith(status_tag):
+                title = f"{status_tag}   {title}"
+            
+            # Extract price
+            price, orig, disc = parse_price(card["price"])
+            
+            games.append({
+                "title": title,
+                "url": url,
+                "price": price,
+                "original_price": orig,
+                "discount_percentage": disc,
+                "status_tag": status_tag
+            })
         
         log(f"W{wid} → Page {page_num}: Found {len(games)} games")
         return games
@@ -175,6 +303,74 @@ async def scrape_list_page(page, page_num, wid):
         log(f"W{wid} → Page {page_num} ERROR: {e}")
         return []
 
+# Any of the blocks scrape_game_details reads; its arrival means the product page has rendered
+DETAIL_READY_SELECTOR = ".details__row, .productcard-rating__score--version-a, .productcard-rating__score--version-b, .content-summary-item__description"
+
+# Header, screenshot and video URLs in one round trip. Images resolve to the largest
+# srcset candidate, else the browser's currentSrc/src - all absolute URLs.
+MEDIA_URLS_JS = """
+() => {
+    const pick = e => {
+        const set = (e.getAttribute("srcset") || "").split(",").pop().trim().split(" ")[0];
+        return (set && new URL(set, location.href).href) || e.currentSrc || e.src || null;
+    };
+    const groups = (selectors, fn) => selectors.map(sel => Array.from(document.querySelectorAll(sel), fn).filter(Boolean));
+    const og = document.querySelector("meta[property='og:image']");
+    const cover = document.querySelector("img[src*='cover'], .productcard-cover img, [class*='hero-image'] img");
+    return {
+        header: (og && og.content) || (cover && pick(cover)),
+        screenshots: groups(["img[src*='screenshots']", "img[src*='/gallery/']", ".media-gallery img", "[class*='screenshot'] img"], pick),
+        videos: groups(["video source[src]", "video[src]", "source[src*='.mp4']", "source[src*='.webm']"], e => e.src)
+    };
+}
+"""
+
+# Texts scrape_game_details reads outside the details table. reviews holds the
+# first match of each review-count selector, in order of preference.
+DETAIL_TEXT_JS = """
+() => {
+    const text = sel => { const e = document.querySelector(sel); return e ? e.textContent : null; };
+    const meta = document.querySelector("meta[property='og:description'], meta[name='description']");
+    return {
+        score: text(".productcard-rating__score--version-a, .productcard-rating__score--version-b"),
+        inline_rating: text(".productcard-rating--inline .rating"),
+        reviews: [".productcard-rating__details-reviews--version-a",
+                  ".productcard-rating__details-reviews--version-b",
+                  ".productcard-rating__details"].map(text),
+        description: text(".content-summary-item__description"),
+        meta_description: meta ? meta.getAttribute("content") : null,
+        genre_links: Array.from(document.querySelectorAll("a[href*='/games?genres=']"), a => a.textContent),
+        os_classes: Array.from(document.querySelectorAll(".productcard-os-support__system"), e => e.getAttribute("class"))
+    };
+}
+"""
+
+# Label, content and link texts for every row of the product details table
+DETAIL_ROWS_JS = """
+() => Array.from(document.querySelectorAll(".table__row.details__row, .details__row")).map(row => {
+    const labelEl = row.querySelector(".details__category, .table__row-label");
+    const content = row.querySelector(".details__content, .table__row-content");
+    const texts = sel => Array.from(row.querySelectorAll(sel)).map(a => a.textContent.trim());
+    const label = labelEl ? labelEl.textContent.trim().toLowerCase() : "";
+    return {
+        label,
+        content: content ? content.textContent.trim() : "",
+        links: texts(".details__content a, .table__row-content a"),
+        // Only the genre row's loose links are used
+        any_links: label.startsWith("genre") ? texts(".details__link, a") : []
+    };
+})
+"""
+
+# Scroll for lazy content, then read every block scrape_game_details uses - one
+# round trip per product page instead of four. Args: SCROLL_JS's [step, maxY, settle]
+PRODUCT_PAGE_JS = f"""
+async args => {{
+    await ({SCROLL_JS})(args);
+    return {{info: ({DETAIL_TEXT_JS})(), rows: ({DETAIL_ROWS_JS})(), media: ({MEDIA_URLS_JS})()}};
+}}
+"""
+
 async def scrape_game_details(page, url, title, wid):
     """Scrape full details from game page - FIXED VERSION"""
     details = {
@@ -192,283 +388,151 @@ async def scrape_game_details(page, url, title, wid):
     }
     
     try:
+        await LIMITER.acquire()
         await page.goto(url, wait_until="domcontentloaded", timeout=CFG['page_timeout'])
-        await page.wait_for_timeout(2000)
+        
+        # Wait for the first block we actually read instead of a fixed 2s
+        try:
+            await page.wait_for_selector(DETAIL_READY_SELECTOR, state="attached", timeout=5000)
+        except PlaywrightTimeout: pass
         
         # Handle cookies
+        await accept_cookies(page)
+        
+        # Scroll to load all content, then read texts, the details table and media URLs
         try:
-            cookie_btn = page.locator("button.cookie-consent__accept, #onetrust-accept-btn-handler").first
-            if await cookie_btn.is_visible(timeout=1000):
-                await cookie_btn.click()
-                await page.wait_for_timeout(300)
-        except: pass
-        
-        # Scroll to load all content
-        for i in range(5):
-            await page.evaluate(f"window.scrollTo(0, {i * 1200})")
-            await page.wait_for_timeout(400)
-        await page.evaluate("window.scrollTo(0, 0)")
-        await page.wait_for_timeout(800)
+            page_data = await page.evaluate(PRODUCT_PAGE_JS, [1200, 6000, 1500])
+        except:
+            page_data = {}
+        info = page_data.get("info") or {}
         
         # === RATING - FIXED EXTRACTION ===
-        # Method 1: productcard-rating__score (most reliable)
-        try:
-            score_elem = page.locator(".productcard-rating__score--version-a, .productcard-rating__score--version-b").first
-            score_text = await score_elem.text_content(timeout=2000)
-            if score_text:
-                # Extract just the number (handles "4.6/5" or "4.6")
-                rating_match = re.search(r'([\d.]+)', score_text.strip())
-                if rating_match:
-                    details["rating"] = rating_match.group(1)
-        except: pass
-        
-        # Method 2: Inline rating in content-summary
-        if details["rating"] == "N/A":
-            try:
-                inline_rating = page.locator(".productcard-rating--inline .rating").first
-                rating_text = await inline_rating.text_content(timeout=1000)
-                if rating_text:
-                    rating_match = re.search(r'([\d.]+)', rating_text.strip())
-                    if rating_match:
-                        details["rating"] = rating_match.group(1)
-            except: pass
+        # Method 1: productcard-rating__score (most reliable), Method 2: inline rating in content-summary
+        for rating_text in (info.get("score"), info.get("inline_rating")):
+            # Extract just the number (handles "4.6/5" or "4.6")
+            rating_match = NUMBER_RE.search(rating_text or "")
+            if rating_match:
+                details["rating"] = rating_match.group(1)
+                break
         
         # === RATING COUNT - FIXED EXTRACTION ===
-        try:
-            # Look for review count in multiple locations
-            review_selectors = [
-                ".productcard-rating__details-reviews--version-a",
-                ".productcard-rating__details-reviews--version-b",
-                ".productcard-rating__details"
-            ]
-            
-            for selector in review_selectors:
-                try:
-                    review_elem = page.locator(selector).first
-                    review_text = await review_elem.text_content(timeout=1000)
-                    if review_text:
-                        # Extract number from "76 Reviews" or "(76 Reviews)"
-                        count_match = re.search(r'(\d+)\s*Review', review_text)
-                        if count_match:
-                            details["rating_count"] = count_match.group(1)
-                            break
-                except: continue
-        except: pass
+        for review_text in info.get("reviews", []):
+            # Extract number from "76 Reviews" or "(76 Reviews)"
+            count_match = REVIEW_COUNT_RE.search(review_text or "")
+            if count_match:
+                details["rating_count"] = count_match.group(1)
+                break
         
         # === DESCRIPTION - FIXED EXTRACTION ===
-        try:
-            # Method 1: Content summary description
-            desc_elem = page.locator(".content-summary-item__description").first
-            desc = await desc_elem.text_content(timeout=2000)
+        # Method 1: Content summary description
+        desc = info.get("description")
+        if desc and len(desc.strip()) > 50:
+            desc = desc.strip()
+            # Remove ellipsis and extra whitespace
+            desc = TRAILING_DOTS_RE.sub('', desc)
+            desc = WHITESPACE_RE.sub(' ', desc).strip()
             
-            if desc and len(desc.strip()) > 50:
-                desc = desc.strip()
-                # Remove ellipsis and extra whitespace
-                desc = re.sub(r'\.\.\.+$', '', desc)
-                desc = re.sub(r'\s+', ' ', desc).strip()
-                
-                # Remove common UI text
-                junk_phrases = [
-                    "Discover the grim dark universes",
-                    "Originally released in",
-                    "See new chat messages",
-                    "friend invites"
-                ]
-                for junk in junk_phrases:
-                    if junk in desc:
-                        desc = desc.split(junk)[0].strip()
-                
-                if len(desc) > 50:
-                    details["description"] = desc[:1000]
-        except: pass
+            # Remove common UI text
+            junk_phrases = [
+                "Discover the grim dark universes",
+                "Originally released in",
+                "See new chat messages",
+                "friend invites"
+            ]
+            for junk in junk_phrases:
+                if junk in desc:
+                    desc = desc.split(junk)[0].strip()
+            
+            if len(desc) > 50:
+                details["description"] = desc[:1000]
         
         # Fallback: Meta description
         if details["description"] == "N/A" or len(details["description"]) < 50:
-            try:
-                meta_desc = await page.locator("meta[property='og:description'], meta[name='description']").first.get_attribute("content", timeout=1000)
-                if meta_desc and len(meta_desc.strip()) > 50:
-                    details["description"] = meta_desc.strip()[:1000]
-            except: pass
+            meta_desc = info.get("meta_description")
+            if meta_desc and len(meta_desc.strip()) > 50:
+                details["description"] = meta_desc.strip()[:1000]
+        
+        # === DETAILS TABLE - every row read once ===
+        rows = page_data.get("rows") or []
         
         # === GENRES - FIXED EXTRACTION ===
-        try:
-            # Method 1: From details table row
-            genre_row = page.locator(".table__row.details__row").filter(has=page.locator("text=/Genre:/i")).first
-            genre_links = await genre_row.locator(".details__link, a").all()
-            
-            genres = []
-            for link in genre_links:
-                text = await link.text_content(timeout=300)
-                if text:
-                    text = text.strip()
-                    if text and len(text) < 40 and text not in ['-', ',', '&']:
-                        genres.append(text)
-            
+        genre_row = next((r for r in rows if r["label"].startswith('genre')), None)
+        if genre_row:
+            genres = [t for t in genre_row["any_links"] if t and len(t) < 40 and t not in ['-', ',', '&']]
             if genres:
                 details["genres"] = ", ".join(genres[:10])
-        except: pass
         
         # Fallback: Genre links
         if details["genres"] == "N/A":
-            try:
-                genre_links = await page.locator("a[href*='/games?genres=']").all()
-                genres = []
-                for link in genre_links[:10]:
-                    text = await link.text_content(timeout=300)
-                    if text and len(text.strip()) < 30:
-                        genres.append(text.strip())
-                if genres:
-                    details["genres"] = ", ".join(genres)
-            except: pass
+            genres = [t.strip() for t in info.get("genre_links", [])[:10] if t and len(t.strip()) < 30]
+            if genres:
+                details["genres"] = ", ".join(genres)
         
         # === OTHER DETAILS FROM TABLE ===
-        try:
-            rows = await page.locator(".table__row.details__row, .details__row").all()
+        for row in rows:
+            label = row["label"]
+            if not label:
+                continue
             
-            for row in rows:
-                try:
-                    # Get the label/category
-                    label_elem = row.locator(".details__category, .table__row-label").first
-                    label = await label_elem.text_content(timeout=500)
-                    
-                    if not label:
-                        continue
-                    
-                    label = label.strip().lower()
-                    
-                    # Release date
-                    if 'release' in label:
-                        content_elem = row.locator(".details__content, .table__row-content").first
-                        content = await content_elem.text_content(timeout=500)
-                        if content:
-                            details["release_date"] = content.strip()
-                    
-                    # Company (Developer/Publisher)
-                    elif 'company' in label or 'developer' in label:
-                        links = await row.locator(".details__content a, .table__row-content a").all()
-                        
-                        if links:
-                            # First link is developer
-                            dev_text = await links[0].text_content(timeout=300)
-                            if dev_text and dev_text.strip():
-                                details["developer"] = dev_text.strip()
-                            
-                            # Second link is publisher (if exists)
-                            if len(links) > 1:
-                                pub_text = await links[1].text_content(timeout=300)
-                                if pub_text and pub_text.strip():
-                                    details["publisher"] = pub_text.strip()
-                    
-                    # Publisher (standalone)
-                    elif 'publisher' in label and details["publisher"] == "N/A":
-                        content_elem = row.locator(".details__content a, .table__row-content a").first
-                        content = await content_elem.text_content(timeout=500)
-                        if content and content.strip():
-                            details["publisher"] = content.strip()
-                    
-                    # Platforms
-                    elif 'works on' in label or 'system' in label:
-                        content = await row.text_content(timeout=500)
-                        plats = []
-                        cl = content.lower()
-                        if 'windows' in cl: plats.append("Windows")
-                        if 'mac' in cl or 'os x' in cl: plats.append("Mac")
-                        if 'linux' in cl: plats.append("Linux")
-                        if plats:
-                            details["platforms"] = ", ".join(plats)
-                
-                except: continue
-        except: pass
-        
-        # === PLATFORMS FALLBACK ===
-        if details["platforms"] == "N/A":
-            try:
-                # Check for OS icons
-                os_icons = await page.locator(".productcard-os-support__system").all()
+            # Release date
+            if 'release' in label:
+                if row["content"]:
+                    details["release_date"] = row["content"]
+            
+            # Company (Developer/Publisher) - first link is developer, second publisher
+            elif 'company' in label or 'developer' in label:
+                links = row["links"]
+                if links and links[0]:
+                    details["developer"] = links[0]
+                if len(links) > 1 and links[1]:
+                    details["publisher"] = links[1]
+            
+            # Publisher (standalone)
+            elif 'publisher' in label and details["publisher"] == "N/A":
+                if row["links"] and row["links"][0]:
+                    details["publisher"] = row["links"][0]
+            
+            # Platforms
+            elif 'works on' in label or 'system' in label:
                 plats = []
-                for icon in os_icons:
-                    class_attr = await icon.get_attribute("class")
-                    if 'windows' in class_attr.lower(): plats.append("Windows")
-                    if 'mac' in class_attr.lower(): plats.append("Mac")
-                    if 'linux' in class_attr.lower(): plats.append("Linux")
+                cl = row["content"].lower()
+                if 'windows' in cl: plats.append("Windows")
+                if 'mac' in cl or 'os x' in cl: plats.append("Mac")
+                if 'linux' in cl: plats.append("Linux")
                 if plats:
-                    details["platforms"] = ", ".join(list(dict.fromkeys(plats)))
-            except: pass
+                    details["platforms"] = ", ".join(plats)
         
-        # === HEADER IMAGE ===
-        try:
-            img = await page.locator("meta[property='og:image']").first.get_attribute("content", timeout=2000)
-            if img and img.startswith("http"):
-                details["header_image"] = img
-        except:
-            try:
-                img = await page.locator("img[src*='cover'], .productcard-cover img, [class*='hero-image'] img").first.get_attribute("src", timeout=2000)
-                if img:
-                    if not img.startswith("http"):
-                        img = f"https:{img}" if img.startswith("//") else f"https://www.gog.com{img}"
-                    details["header_image"] = img
-            except: pass
-        
-        # === SCREENSHOTS ===
-        try:
-            img_selectors = [
-                "img[src*='screenshots']",
-                "img[src*='/gallery/']",
-                ".media-gallery img",
-                "[class*='screenshot'] img"
-            ]
-            
-            for selector in img_selectors:
-                img_elems = await page.locator(selector).all()
-                for img in img_elems:
-                    if len(details["screenshots"]) >= CFG['max_screenshots']:
-                        break
-                    
-                    src = await img.get_attribute("src")
-                    if src:
-                        if src.startswith("//"):
-                            src = f"https:{src}"
-                        elif src.startswith("/"):
-                            src = f"https://www.gog.com{src}"
-                        
-                        src = re.sub(r'([_-])(256|512|thumb)\.', r'\g<1>1024.', src)
-                        
-                        if src.startswith("http") and src not in details["screenshots"]:
-                            details["screenshots"].append(src)
-                
-                if details["screenshots"]:
-                    break
-        except: pass
+        # === PLATFORMS FALLBACK ===
+        if details["platforms"] == "N/A":
+            # Check for OS icons
+            plats = []
+            for class_attr in info.get("os_classes", []):
+                class_attr = (class_attr or "").lower()
+                if 'windows' in class_attr: plats.append("Windows")
+                if 'mac' in class_attr: plats.append("Mac")
+                if 'linux' in class_attr: plats.append("Linux")
+            if plats:
+                details["platforms"] = ", ".join(list(dict.fromkeys(plats)))
+        
+        # === HEADER IMAGE / SCREENSHOTS / VIDEOS === (URLs already absolute)
+        media = page_data.get("media") or {"header": None, "screenshots": [], "videos": []}
+        
+        if media["header"] and media["header"].startswith("http"):
+            details["header_image"] = media["header"]
+        
+        # First selector group that yields anything wins; dict keys dedupe in order
+        for group in media["screenshots"]:
+            shots = dict.fromkeys(src for src in (THUMB_SIZE_RE.sub(r'\g<1>1024.', s) for s in group)
+                                  if src.startswith("http"))
+            if shots:
+                details["screenshots"] = list(shots)[:CFG['max_screenshots']]
+                break
         
-        # === VIDEOS ===
-        try:
-            video_selectors = [
-                "video source[src]",
-                "video[src]",
-                "source[src*='.mp4']",
-                "source[src*='.webm']"
-            ]
-            
-            for selector in video_selectors:
-                vid_elems = await page.locator(selector).all()
-                for vid in vid_elems:
-                    if len(details["videos"]) >= CFG['max_videos']:
-                        break
-                    
-                    src = await vid.get_attribute("src")
-                    
-                    if src:
-                        if src.startswith("//"):
-                            src = f"https:{src}"
-                        elif src.startswith("/"):
-                            src = f"https://www.gog.com{src}"
-                        
-                        if src not in details["videos"] and any(ext in src.lower() for ext in ['.mp4', '.webm']):
-                            details["videos"].append(src)
-                
-                if details["videos"]:
-                    break
-        except: pass
+        for group in media["videos"]:
+            videos = dict.fromkeys(src for src in group if VIDEO_FILE_RE.search(src))
+            if videos:
+                details["videos"] = list(videos)[:CFG['max_videos']]
+                break
         
         return details
         
@@ -476,85 +540,154 @@ async def scrape_game_details(page, url, title, wid):
         log(f"W{wid} ⚠️  Detail error for {title}: {str(e)[:80]}")
         return details
 
-async def worker(context, pages_to_scrape, wid):
-    """Worker that processes assigned pages"""
+async def worker(context, pages_to_scrape, wid, sink):
+    """Worker that processes assigned pages, streaming each game to `sink`"""
     page = await context.new_page()
-    all_games = []
+    scraped = 0
+    pending = []  # media downloads still running for this page's games
     
     try:
         for page_num in pages_to_scrape:
             games = await scrape_list_page(page, page_num, wid)
             
             for idx, game in enumerate(games, 1):
+                # Catalog pages shift while we crawl; skip games another worker has taken
+                if not claim(sink, game['url']):
+                    scraped += 1
+                    continue
+                
                 try:
                     details = await scrape_game_details(page, game['url'], game['title'], wid)
-                    game.update(details)
+                    # Product-page values win; catalog API values fill what the page lacked
+                    for key, value in details.items():
+                        if value not in ("N/A", []) or key not in game:
+                            game[key] = value
                     
+                    scraped += 1
                     if CFG['download_media']:
-                        game = download_media(game)
-                    
-                    all_games.append(game)
+                        # Media downloads while this tab moves on to the next game
+                        pending.append(asyncio.create_task(download_and_write(sink, game)))
+                    else:
+                        write_row(sink, game)
                     
                     if idx % 3 == 0:
                         log(f"W{wid} → Page {page_num}: {idx}/{len(games)} games")
                     
-                    await page.wait_for_timeout(random.randint(400, 900))
-                    
                 except Exception as e:
                     log(f"W{wid} ⚠️  Error on {game.get('title', 'Unknown')}: {str(e)[:40]}")
-                    all_games.append(game)
+                    scraped += 1
+                    write_row(sink, game)
                     continue
             
-            log(f"W{wid} → Page {page_num}: ✓ {len(games)} games (Total: {len(all_games)})")
-            await page.wait_for_timeout(random.randint(2000, 4000))
+            if pending:
+                await asyncio.gather(*pending)
+                pending.clear()
+            sink['file'].flush()
+            log(f"W{wid} → Page {page_num}: ✓ {len(games)} games (Total: {scraped})")
         
     finally:
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
         await page.close()
     
-    log(f"W{wid} → FINISHED: {len(all_games)} games")
-    return all_games
+    log(f"W{wid} → FINISHED: {scraped} games")
+    return scraped
+
+async def fetch_file(url, path):
+    """download_file on the shared media pool, bounded by MEDIA_SLOTS"""
+    async with MEDIA_SLOTS:
+        return await run_download(download_file, url, path)
+
+async def download_and_write(sink, game):
+    """Download a game's media, then write its row. A failed download is logged and
+    the row written without media, so one game never takes its worker down."""
+    try:
+        game = await download_media(game)
+    except Exception as e:
+        log(f"⚠️  Media failed for {game.get('title', 'Unknown')}: {str(e)[:40]}")
+    finally:
+        write_row(sink, game)
 
-def download_media(game_data, base_dir="scraped_data/game_media_gog"):
-    """Download screenshots and videos"""
+async def download_media(game_data, base_dir="scraped_data/game_media_gog"):
+    """Download screenshots and videos concurrently without blocking the other workers"""
     if not CFG['download_media']:
         return game_data
     
-    safe_title = sanitize(game_data.get("title", "game"))
+    safe_title = safe_dirname(game_data.get("title", "game"), 80)
     media_dir = os.path.join(base_dir, safe_title)
     
-    downloaded_images = []
-    downloaded_videos = []
+    image_paths = []
+    video_paths = []
     
     # Header
     if game_data.get("header_image") and game_data["header_image"] != "N/A":
-        path = os.path.join(media_dir, "header.jpg")
-        if download_file(game_data["header_image"], path):
-            downloaded_images.append(path)
+        image_paths.append((game_data["header_image"], os.path.join(media_dir, "header.jpg")))
     
     # Screenshots
     screenshots = game_data.get("screenshots", [])
     if isinstance(screenshots, list):
         for idx, url in enumerate(screenshots, 1):
-            path = os.path.join(media_dir, f"screenshot_{idx}.jpg")
-            if download_file(url, path):
-                downloaded_images.append(path)
+            image_paths.append((url, os.path.join(media_dir, f"screenshot_{idx}.jpg")))
     
     # Videos
     videos = game_data.get("videos", [])
     if isinstance(videos, list):
         for idx, url in enumerate(videos, 1):
             ext = ".mp4" if ".mp4" in url.lower() else ".webm"
-            path = os.path.join(media_dir, f"video_{idx}{ext}")
-            if download_file(url, path):
-                downloaded_videos.append(path)
+            video_paths.append((url, os.path.join(media_dir, f"video_{idx}{ext}")))
+    
+    # One folder per game, made here rather than once per file
+    if image_paths or video_paths:
+        os.makedirs(media_dir, exist_ok=True)
+    results = await asyncio.gather(*(fetch_file(url, path) for url, path in image_paths + video_paths))
+    downloaded_images = [p for p in results[:len(image_paths)] if p]
+    downloaded_videos = [p for p in results[len(image_paths):] if p]
     
     game_data["downloaded_images"] = ", ".join(downloaded_images) if downloaded_images else "N/A"
     game_data["downloaded_videos"] = ", ".join(downloaded_videos) if downloaded_videos else "N/A"
     
     return game_data
 
-async def scrape(pages=11, workers=3, headless=True, download_media=True):
-    """Main scraping function"""
+# Media URLs come from src/srcset attributes, which are set whether or not the bytes
+# arrive. Stylesheets stay: the lazy-loaders need real layout to fire while scrolling.
+GOG_BLOCKED_TYPES = frozenset({"image", "font", "media"})
+
+async def block_gog_resources(route):
+    """Route handler for catalog and product pages"""
+    if route.request.resource_type in GOG_BLOCKED_TYPES or TRACKER_URL_RE.match(route.request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+async def crawl(browser, pages, workers, sink):
+    """Split catalog pages across workers sharing one browser context"""
+    scraped = 0
+    context = await browser.new_context(
+        viewport={'width': 1920, 'height': 1080},
+        user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        service_workers=SERVICE_WORKERS
+    )
+    await context.route("**/*", block_gog_resources)
+    
+    try:
+        tasks = []
+        
+        # Round-robin so no worker is stuck with all the slow tail pages
+        for i in range(workers):
+            worker_pages = list(range(i + 1, pages + 1, workers))
+            if not worker_pages:
+                break
+            tasks.append(worker(context, worker_pages, i + 1, sink))
+        
+        results = await asyncio.gather(*tasks)
+        scraped = sum(results)
+    finally:
+        await context.close()
+    
+    return scraped
+
+async def scrape(pages=11, workers=3, headless=True, download_media=True, browser=None):
+    """Main scraping function. Reuses `browser` if given (e.g. shared with another scraper)"""
     CFG['workers'] = workers
     CFG['headless'] = headless
     CFG['download_media'] = download_media
@@ -566,102 +699,71 @@ async def scrape(pages=11, workers=3, headless=True, download_media=True):
     log(f"🚫 Filtering: DLCs, expansions, and microtransactions excluded")
     
     start = time.time()
-    all_games = []
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=headless)
-        context = await browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        )
-        
-        pages_per_worker = max(1, pages // workers)
-        tasks = []
-        
-        for i in range(workers):
-            start_page = i * pages_per_worker + 1
-            end_page = min(pages, start_page + pages_per_worker - 1) if i < workers - 1 else pages
-            if start_page > pages:
-                break
-            
-            worker_pages = list(range(start_page, end_page + 1))
-            tasks.append(worker(context, worker_pages, i + 1))
-        
-        results = await asyncio.gather(*tasks)
-        
-        for result in results:
-            all_games.extend(result)
-        
-        await browser.close()
+    # Rows are written as they are scraped; the URL set dedupes across workers
+    OUT_FILE.parent.mkdir(exist_ok=True)
+    with open(OUT_FILE, 'w', newline='', encoding='utf-8-sig') as f:
+        writer = csv.DictWriter(f, fieldnames=COLS_ORDER, extrasaction='ignore')
+        writer.writeheader()
+        sink = {'file': f, 'writer': writer, 'seen': set(), 'claimed': set()}
+        
+        if browser is None:
+            async with async_playwright() as p:
+                browser = await p.chromium.launch(headless=headless, args=CHROMIUM_ARGS, executable_path=CHROMIUM_PATH)
+                try:
+                    scraped = await crawl(browser, pages, workers, sink)
+                finally:
+                    await browser.close()
+        else:
+            scraped = await crawl(browser, pages, workers, sink)
     
     elapsed = time.time() - start
     
-    if not all_games:
+    if not sink['seen']:
         log("❌ No games scraped")
         return []
     
-    df = pd.DataFrame(all_games)
-    
-    # Dedupe
-    if 'url' in df.columns:
-        before = len(df)
-        df = df.drop_duplicates(subset=['url'], keep='first')
-        if before > len(df):
-            log(f"🗑️  Removed {before - len(df)} duplicates")
-    
-    # Convert lists to strings
-    for col in ['screenshots', 'videos']:
-        if col in df.columns:
-            df[col] = df[col].apply(lambda x: ", ".join(x) if isinstance(x, list) else x)
-    
-    # Column order
-    cols_order = ['title', 'url', 'price', 'original_price', 'discount_percentage', 
-                  'rating', 'rating_count', 'release_date', 'genres', 'platforms', 
-                  'developer', 'publisher', 'description', 'status_tag',
-                  'screenshots', 'videos', 'header_image', 
-                  'downloaded_images', 'downloaded_videos']
-    
-    df = df[[c for c in cols_order if c in df.columns]]
-    
-    # Save
-    out_dir = Path("scraped_data")
-    out_dir.mkdir(exist_ok=True)
-    out_file = out_dir / "gog_games_complete.csv"
+    if scraped > len(sink['seen']):
+        log(f"🗑️  Removed {scraped - len(sink['seen'])} duplicates")
     
-    df.to_csv(out_file, index=False, encoding='utf-8-sig')
+    # Read back once for the report - plain rows, no DataFrame needed for a few counts
+    with open(OUT_FILE, newline='', encoding='utf-8-sig') as f:
+        rows = list(csv.DictReader(f))
+    total = len(rows)
     
     # Stats
     log(f"\n{'='*70}")
-    log(f"✅ SUCCESS: {len(df)} games in {elapsed:.1f}s ({len(df)/elapsed:.2f} games/s)")
-    log(f"💾 Saved: {out_file}")
+    log(f"✅ SUCCESS: {total} games in {elapsed:.1f}s ({total/elapsed:.2f} games/s)")
+    log(f"💾 Saved: {OUT_FILE}")
     
+    known = lambda col: sum(1 for r in rows if r[col] != 'N/A')
     stats = {
-        'Ratings': len(df[df['rating'] != 'N/A']),
-        'Rating Counts': len(df[df['rating_count'] != 'N/A']),
-        'Descriptions': len(df[(df['description'] != 'N/A') & (df['description'].str.len() > 100)]),
-        'Genres': len(df[df['genres'] != 'N/A']),
-        'Platforms': len(df[df['platforms'] != 'N/A']),
-        'Developer': len(df[df['developer'] != 'N/A']),
-        'Publisher': len(df[df['publisher'] != 'N/A']),
-        'Screenshots': len(df[df['screenshots'].str.len() > 10]),
-        'Videos': len(df[df['videos'].str.len() > 10])
+        'Ratings': known('rating'),
+        'Rating Counts': known('rating_count'),
+        'Descriptions': sum(1 for r in rows if r['description'] != 'N/A' and len(r['description']) > 100),
+        'Genres': known('genres'),
+        'Platforms': known('platforms'),
+        'Developer': known('developer'),
+        'Publisher': known('publisher'),
+        'Screenshots': sum(1 for r in rows if len(r['screenshots']) > 10),
+        'Videos': sum(1 for r in rows if len(r['videos']) > 10)
     }
     
     log(f"\n📈 Data Quality:")
     for key, val in stats.items():
-        pct = 100 * val / len(df)
-        log(f"   {key}: {val}/{len(df)} ({pct:.1f}%)")
+        pct = 100 * val / total
+        log(f"   {key}: {val}/{total} ({pct:.1f}%)")
     
     log(f"{'='*70}\n")
     
     # Sample
-    if len(df) > 0:
+    if rows:
         print("\n📋 Sample (First 3 games):")
         sample_cols = ['title', 'rating', 'rating_count', 'genres', 'platforms', 'developer']
-        sample_cols = [c for c in sample_cols if c in df.columns]
-        print(df[sample_cols].head(3).to_string(index=False, max_colwidth=50))
+        for r in rows[:3]:
+            print("  " + " | ".join(r[c][:50] for c in sample_cols))
     
-    return df.to_dict(orient='records')
+    return rows
 
 def main():
     import argparse
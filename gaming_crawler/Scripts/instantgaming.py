@@ -1,8 +1,13 @@
-import pandas as pd
-from playwright.async_api import async_playwright
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
 import asyncio
-import time, os, requests, re, sys, argparse
+import time, os, re, sys, argparse, csv, io
 from datetime import datetime
+from common import CHROMIUM_PATH, CHROMIUM_ARGS, SERVICE_WORKERS, SESSION, image_ext, safe_dirname, save_stream, run_download, RateLimiter, block_heavy_resources
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
 
 # Force UTF-8 encoding and disable buffering
 if sys.platform.startswith('win'):
@@ -13,17 +18,25 @@ if sys.platform.startswith('win'):
 # Force unbuffered output
 sys.stdout.reconfigure(line_buffering=True) if hasattr(sys.stdout, 'reconfigure') else None
 
+# Re-encode downloaded JPEG/PNG images as WebP (set by --webp, needs Pillow)
+CONVERT_TO_WEBP = False
+
 def download_media(url, save_dir, filename):
     """Download images and videos from URLs."""
     if not url or url == "N/A" or not url.startswith('http'): 
         return None
     try:
-        r = requests.get(url, timeout=15, stream=True, headers={'User-Agent': 'Mozilla/5.0'})
-        if r.status_code == 200:
-            filepath = os.path.join(save_dir, filename)
-            with open(filepath, 'wb') as f:
-                for chunk in r.iter_content(8192): f.write(chunk)
-            return filepath
+        with SESSION.get(url, timeout=15, stream=True) as r:
+            if r.status_code == 200:
+                filepath = os.path.join(save_dir, filename)
+                root, ext = os.path.splitext(filepath)
+                if CONVERT_TO_WEBP and Image and ext in ('.jpg', '.png'):
+                    # One raw read; r.content would assemble the body from 10 KiB chunks
+                    r.raw.decode_content = True
+                    img = Image.open(io.BytesIO(r.raw.read())).convert('RGB')
+                    img.save(root + '.webp', 'WEBP', quality=80, method=6)
+                    return root + '.webp'
+                return save_stream(r, filepath)
     except: pass
     return None
 
@@ -33,8 +46,76 @@ def safe_text(text):
         return "N/A"
     return text.replace('\n', ' ').replace('\r', '').replace('\t', ' ').strip()
 
-async def scrape_game_details(page, game_url, game_title, download_media_files=True):
-    """Scrape game details - async version"""
+# Patterns used per game, compiled once
+PRODUCT_ID_RE = re.compile(r'/(\d+)-')
+CURRENCY_RE = re.compile(r'[€$£¥₹₽]')
+REVIEW_COUNT_RE = re.compile(r'\((\d+)\)')
+# Gift cards and other non-games, matched in one scan of each title
+SKIP_TITLE_RE = re.compile(r'gift card|points|gems|credits|wallet|season pass', re.IGNORECASE)
+
+OUTPUT_CSV = "scraped_data/instant_gaming_data.csv"
+# Resolved once at import rather than for every game
+MEDIA_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "scraped_data", "instant_gaming_media")
+CSV_FIELDS = [
+    "title", "url", "developer", "publisher", "platforms", "genre", "release_date", "description",
+    "current_price", "original_price", "discount_percentage", "currency", "stock_status",
+    "ig_rating", "review_count", "steam_recent_reviews", "steam_all_reviews", "steam_review_count",
+    "video_url", "header_image", "screenshots", "user_tags", "game_features",
+    "system_requirements_min", "system_requirements_rec", "product_id", "editions", "scrape_timestamp"
+]
+
+def csv_row(details):
+    """Flatten list fields into '|'-joined strings for CSV"""
+    return {k: ('|'.join(v) if v else 'N/A') if isinstance(v, list) else v for k, v in details.items()}
+
+# Text of every product-page field scrape_game_details reads, plus the media URLs (null when absent)
+DETAILS_JS = """
+() => {
+    const text = (sel, root = document) => { const e = root.querySelector(sel); return e ? e.innerText : null; };
+    const texts = sel => Array.from(document.querySelectorAll(sel), e => e.innerText.trim());
+    const attr = (sel, name) => { const e = document.querySelector(sel); return e ? e.getAttribute(name) : null; };
+    const meta = prop => attr(`meta[itemprop='${prop}']`, "content");
+    // Second cell of the first table row mentioning label (Playwright's tr:has-text)
+    const reviewCell = label => {
+        const row = Array.from(document.querySelectorAll("tr")).find(tr =>
+            tr.textContent.toLowerCase().includes(label) && tr.querySelector("th:nth-child(2)"));
+        return row ? row.querySelector("th:nth-child(2)") : null;
+    };
+    const recent = reviewCell("recent steam reviews");
+    const all = reviewCell("all steam reviews");
+    return {
+        price: text(".amount .total"),
+        retail: text(".amount .discounts .retail"),
+        discount: text(".amount .discounted"),
+        stock: text(".stock span"),
+        developer: meta("author"),
+        publisher: meta("publisher"),
+        platforms: meta("gamePlatform"),
+        genre: text("tr.genres a.tag"),
+        release_date: text("tr.release-date th:nth-child(2)"),
+        description: text("span[itemprop='description']"),
+        description_alt: text(".product-text .text"),
+        ig_rating: text(".ig-search-reviews-avg"),
+        review_count: text(".based .link"),
+        steam_recent: recent ? recent.innerText : null,
+        steam_all: all ? text("span", all) : null,
+        steam_all_count: all ? text("span:nth-child(2)", all) : null,
+        tags: texts(".users-tags a.searchtag"),
+        features: texts(".features-listing a.feature .feature-text"),
+        min_reqs: texts(".minimal ul.specs li"),
+        rec_reqs: texts(".recommended ul.specs li"),
+        editions: Array.from(document.querySelectorAll(".editions .item"), item => ({
+            name: text(".name h3", item), price: text(".amount .total", item)
+        })),
+        header_image: meta("image"),
+        video_url: attr("#ig-vimeo-player", "src"),
+        screenshots: Array.from(document.querySelectorAll(".screenshots a[itemprop='screenshot']"), a => a.getAttribute("href"))
+    };
+}
+"""
+
+async def scrape_game_details(page, game_url, game_title):
+    """Scrape game details - async version. Media is downloaded separately by download_game_media."""
     details = {
         "title": game_title, "url": game_url, "developer": "N/A", "publisher": "N/A",
         "platforms": "N/A", "genre": "N/A", "release_date": "N/A", "description": "N/A",
@@ -47,288 +128,191 @@ async def scrape_game_details(page, game_url, game_title, download_media_files=T
     }
     
     try:
-        await page.goto(game_url, wait_until="load", timeout=60000)
-        await page.wait_for_timeout(2000)
-        
-        safe_title = re.sub(r'[<>:"/\\|?*]', '', game_title)[:50].strip()
-        game_media_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 
-                                      "scraped_data", "instant_gaming_media", safe_title)
-        os.makedirs(game_media_dir, exist_ok=True)
-        
-        # Product ID
-        id_match = re.search(r'/(\d+)-', game_url)
-        if id_match: details["product_id"] = id_match.group(1)
-        
-        # PRICING
+        # Return at DOMContentLoaded - "load" blocks on trackers, ads and the Vimeo iframe
+        await page.goto(game_url, wait_until="domcontentloaded", timeout=20000)
         try:
-            price_elem = page.locator(".amount .total").first
-            if await price_elem.count() > 0:
-                details["current_price"] = safe_text(await price_elem.inner_text())
-                currency_match = re.search(r'[€$£¥₹₽]', details["current_price"])
-                if currency_match: details["currency"] = currency_match.group()
+            await page.wait_for_selector(".amount .total, span[itemprop='description']", timeout=5000)
         except: pass
         
-        try:
-            retail_elem = page.locator(".amount .discounts .retail").first
-            if await retail_elem.count() > 0:
-                details["original_price"] = safe_text(await retail_elem.inner_text())
-        except: pass
+        # Product ID
+        id_match = PRODUCT_ID_RE.search(game_url)
+        if id_match: details["product_id"] = id_match.group(1)
         
+        # Every text field in one round trip instead of two per locator
         try:
-            discount_elem = page.locator(".amount .discounted").first
-            if await discount_elem.count() > 0:
-                details["discount_percentage"] = safe_text(await discount_elem.inner_text())
-        except: pass
+            info = await page.evaluate(DETAILS_JS)
+        except:
+            info = {}
         
-        try:
-            stock_elem = page.locator(".stock span").first
-            if await stock_elem.count() > 0:
-                details["stock_status"] = safe_text(await stock_elem.inner_text())
-        except: pass
+        # PRICING
+        details["current_price"] = safe_text(info.get("price"))
+        currency_match = CURRENCY_RE.search(details["current_price"])
+        if currency_match: details["currency"] = currency_match.group()
+        details["original_price"] = safe_text(info.get("retail"))
+        details["discount_percentage"] = safe_text(info.get("discount"))
+        details["stock_status"] = safe_text(info.get("stock"))
         
         # META TAGS
-        try:
-            dev_meta = page.locator('meta[itemprop="author"]').first
-            if await dev_meta.count() > 0:
-                details["developer"] = safe_text(await dev_meta.get_attribute("content"))
-        except: pass
-        
-        try:
-            pub_meta = page.locator('meta[itemprop="publisher"]').first
-            if await pub_meta.count() > 0:
-                details["publisher"] = safe_text(await pub_meta.get_attribute("content"))
-        except: pass
-        
-        try:
-            platform_meta = page.locator('meta[itemprop="gamePlatform"]').first
-            if await platform_meta.count() > 0:
-                details["platforms"] = safe_text(await platform_meta.get_attribute("content"))
-        except: pass
+        details["developer"] = safe_text(info.get("developer"))
+        details["publisher"] = safe_text(info.get("publisher"))
+        details["platforms"] = safe_text(info.get("platforms"))
         
         # TABLE DATA
-        try:
-            genre_row = page.locator("tr.genres a.tag").first
-            if await genre_row.count() > 0:
-                details["genre"] = safe_text(await genre_row.inner_text())
-        except: pass
-        
-        try:
-            date_row = page.locator("tr.release-date th:nth-child(2)").first
-            if await date_row.count() > 0:
-                details["release_date"] = safe_text(await date_row.inner_text())
-        except: pass
+        details["genre"] = safe_text(info.get("genre"))
+        details["release_date"] = safe_text(info.get("release_date"))
         
         # DESCRIPTION
-        try:
-            desc_elem = page.locator("span[itemprop='description']").first
-            if await desc_elem.count() > 0:
-                desc = (await desc_elem.inner_text()).strip()
-                details["description"] = safe_text(desc[:1000])
-        except: pass
-        
-        if details["description"] == "N/A":
-            try:
-                desc_elem = page.locator(".product-text .text").first
-                if await desc_elem.count() > 0:
-                    desc = (await desc_elem.inner_text()).strip()
-                    details["description"] = safe_text(desc[:1000])
-            except: pass
+        for key in ("description", "description_alt"):
+            desc = (info.get(key) or "").strip()
+            details["description"] = safe_text(desc[:1000])
+            if details["description"] != "N/A":
+                break
         
         # RATINGS
-        try:
-            rating_elem = page.locator(".ig-search-reviews-avg").first
-            if await rating_elem.count() > 0:
-                details["ig_rating"] = safe_text(await rating_elem.inner_text())
-        except: pass
-        
-        try:
-            review_count_elem = page.locator(".based .link").first
-            if await review_count_elem.count() > 0:
-                details["review_count"] = safe_text(await review_count_elem.inner_text())
-        except: pass
-        
-        try:
-            steam_recent = page.locator("tr:has-text('Recent Steam reviews') th:nth-child(2)").first
-            if await steam_recent.count() > 0:
-                details["steam_recent_reviews"] = safe_text(await steam_recent.inner_text())
-        except: pass
-        
-        try:
-            steam_all_elem = page.locator("tr:has-text('All Steam reviews') th:nth-child(2) span").first
-            if await steam_all_elem.count() > 0:
-                details["steam_all_reviews"] = safe_text(await steam_all_elem.inner_text())
-            
-            steam_count = page.locator("tr:has-text('All Steam reviews') th:nth-child(2) span:nth-child(2)").first
-            if await steam_count.count() > 0:
-                count_text = await steam_count.inner_text()
-                count_match = re.search(r'\((\d+)\)', count_text)
-                if count_match:
-                    details["steam_review_count"] = count_match.group(1)
-        except: pass
-        
-        # TAGS
-        try:
-            tag_links = await page.locator(".users-tags a.searchtag").all()
-            tags = []
-            for tag in tag_links[:20]:
-                tag_text = (await tag.inner_text()).strip()
-                if tag_text and tag_text != "...":
-                    tags.append(tag_text)
-            details["user_tags"] = tags
-        except: pass
-        
-        # FEATURES
-        try:
-            feature_links = await page.locator(".features-listing a.feature .feature-text").all()
-            features = []
-            for feat in feature_links:
-                feat_text = (await feat.inner_text()).strip()
-                if feat_text:
-                    features.append(feat_text)
-            details["game_features"] = features
-        except: pass
+        details["ig_rating"] = safe_text(info.get("ig_rating"))
+        details["review_count"] = safe_text(info.get("review_count"))
+        details["steam_recent_reviews"] = safe_text(info.get("steam_recent"))
+        details["steam_all_reviews"] = safe_text(info.get("steam_all"))
+        count_match = REVIEW_COUNT_RE.search(info.get("steam_all_count") or "")
+        if count_match:
+            details["steam_review_count"] = count_match.group(1)
+        
+        # TAGS / FEATURES
+        details["user_tags"] = [t for t in info.get("tags", [])[:20] if t and t != "..."]
+        details["game_features"] = [f for f in info.get("features", []) if f]
         
         # SYSTEM REQUIREMENTS
-        try:
-            min_items = await page.locator(".minimal ul.specs li").all()
-            min_reqs = []
-            for item in min_items:
-                min_reqs.append(safe_text(await item.inner_text()))
-            if min_reqs:
-                details["system_requirements_min"] = " | ".join(min_reqs)
-        except: pass
-        
-        try:
-            rec_items = await page.locator(".recommended ul.specs li").all()
-            rec_reqs = []
-            for item in rec_items:
-                rec_reqs.append(safe_text(await item.inner_text()))
-            if rec_reqs:
-                details["system_requirements_rec"] = " | ".join(rec_reqs)
-        except: pass
+        if info.get("min_reqs"):
+            details["system_requirements_min"] = " | ".join(safe_text(r) for r in info["min_reqs"])
+        if info.get("rec_reqs"):
+            details["system_requirements_rec"] = " | ".join(safe_text(r) for r in info["rec_reqs"])
         
         # EDITIONS
-        try:
-            edition_items = await page.locator(".editions .item").all()
-            editions = []
-            for edition in edition_items[:5]:
-                try:
-                    name_elem = edition.locator(".name h3").first
-                    price_elem = edition.locator(".amount .total").first
-                    
-                    if await name_elem.count() > 0 and await price_elem.count() > 0:
-                        edition_name = safe_text(await name_elem.inner_text())
-                        edition_price = safe_text(await price_elem.inner_text())
-                        editions.append(f"{edition_name}: {edition_price}")
-                except: continue
-            
-            if editions:
-                details["editions"] = editions
-        except: pass
+        editions = [f"{safe_text(e['name'])}: {safe_text(e['price'])}"
+                    for e in info.get("editions", [])[:5] if e["name"] is not None and e["price"] is not None]
+        if editions:
+            details["editions"] = editions
         
         # MEDIA
-        try:
-            img_meta = page.locator('meta[itemprop="image"]').first
-            if await img_meta.count() > 0:
-                details["header_image"] = await img_meta.get_attribute("content")
-                if download_media_files and details["header_image"] != "N/A":
-                    download_media(details["header_image"], game_media_dir, "cover.jpg")
-        except: pass
+        if info.get("header_image"):
+            details["header_image"] = info["header_image"]
         
-        try:
-            video_iframe = page.locator("#ig-vimeo-player").first
-            if await video_iframe.count() > 0:
-                details["video_url"] = await video_iframe.get_attribute("src")
-        except: pass
-        
-        try:
-            screenshot_links = await page.locator(".screenshots a[itemprop='screenshot']").all()
-            screenshots = []
-            for idx, link in enumerate(screenshot_links[:10]):
-                try:
-                    href = await link.get_attribute("href")
-                    if href:
-                        screenshots.append(href)
-                        if download_media_files:
-                            ext = "jpg"
-                            if ".png" in href.lower(): ext = "png"
-                            elif ".webp" in href.lower(): ext = "webp"
-                            download_media(href, game_media_dir, f"screenshot_{idx+1}.{ext}")
-                except: continue
-            details["screenshots"] = screenshots
-        except: pass
+        if info.get("video_url"):
+            details["video_url"] = info["video_url"]
         
+        details["screenshots"] = [href for href in info.get("screenshots", [])[:10] if href]
         
     except Exception as e:
         print(f"✗ Error scraping {game_title}: {e}", flush=True)
     
     return details
 
-async def scrape_search_page(page, page_num, search_query=""):
-    """Scrape games from search page"""
+async def download_game_media(details):
+    """Download a game's cover and screenshots concurrently, off the event loop"""
+    downloads = []
+    if details["header_image"] != "N/A":
+        downloads.append((details["header_image"], "cover.jpg"))
+    downloads += [(href, f"screenshot_{idx+1}.{image_ext(href)}") for idx, href in enumerate(details["screenshots"])]
+    if not downloads:
+        return
+    
+    # Blocking requests/file I/O would stall every other game on this loop
+    game_media_dir = os.path.join(MEDIA_ROOT, safe_dirname(details["title"]))
+    os.makedirs(game_media_dir, exist_ok=True)
+    await asyncio.gather(*(run_download(download_media, url, game_media_dir, filename)
+                           for url, filename in downloads), return_exceptions=True)
+
+async def new_context(browser):
+    """Browser context that skips images/CSS/fonts - only DOM text and attributes are scraped"""
+    context = await browser.new_context(
+        user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+        viewport={'width': 1920, 'height': 1080},
+        service_workers=SERVICE_WORKERS
+    )
+    await context.route("**/*", block_heavy_resources)
+    return context
+
+SEARCH_CARDS_JS = """
+() => Array.from(document.querySelectorAll("article.item")).map(item => {
+    const link = item.querySelector("a.cover, a.picture, a[href*='/en/']");
+    const titleElem = item.querySelector(".name .title, .title, h3");
+    return {
+        href: link ? link.getAttribute("href") : null,
+        title: titleElem ? (titleElem.getAttribute("title") || titleElem.innerText.trim()) : null
+    };
+})
+"""
+
+SEARCH_PACER = RateLimiter(1.0)  # be polite: search page loads start a second apart
+
+# Scrolls to the bottom until the page stops growing, all in one round trip.
+# Args: [max scrolls, ms to wait for new content after each scroll]
+SCROLL_TO_END_JS = """
+async ([rounds, timeout]) => {
+    for (let i = 0; i < rounds; i++) {
+        const height = document.body.scrollHeight;
+        window.scrollTo(0, height);
+        const start = performance.now();
+        while (document.body.scrollHeight <= height) {
+            if (performance.now() - start > timeout) return;
+            await new Promise(r => setTimeout(r, 100));
+        }
+    }
+}
+"""
+
+SEARCH_URL = "https://www.instant-gaming.com/en/search/"
+
+def listing_page_urls(base_url, pages):
+    """Yield (page number, URL) for the first `pages` pages of a listing.
+    The query separator is worked out once per listing, not once per page."""
+    template = f"{base_url}{'&' if '?' in base_url else '?'}page={{}}"
+    yield 1, base_url
+    for page_num in range(2, pages + 1):
+        yield page_num, template.format(page_num)
+
+async def scrape_search_page(page, page_num, page_url):
+    """Scrape games from one page of a search or category listing"""
     games = []
     
     try:
-        # Build search URL
-        if search_query:
-            base_url = f"https://www.instant-gaming.com/en/search/?q={search_query}"
-        else:
-            # Use generic search to get all games
-            base_url = "https://www.instant-gaming.com/en/search/"
-        
-        separator = '&' if '?' in base_url else '?'
-        page_url = f"{base_url}{separator}page={page_num}" if page_num > 1 else base_url
-        
         print(f"[Search Page {page_num}] Loading: {page_url[:80]}...", flush=True)
         
+        await SEARCH_PACER.acquire()
         await page.goto(page_url, wait_until="domcontentloaded", timeout=60000)
-        await page.wait_for_timeout(3000)
+        try:
+            await page.wait_for_selector("article.item", timeout=10000)
+        except PlaywrightTimeout:
+            pass
         
-        # Scroll to load lazy content
-        for _ in range(5):
-            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            await page.wait_for_timeout(1000)
+        # Scroll to load lazy content until the page stops growing
+        await page.evaluate(SCROLL_TO_END_JS, [10, 3000])
         
-        # Try multiple selectors for game items
-        items = await page.locator(".search article.item, .listing-items article.item, article.item").all()
+        # Pull link + title for every card in a single round-trip
+        items = await page.evaluate(SEARCH_CARDS_JS)
         
         if not items:
             print(f"[Search Page {page_num}] No items found", flush=True)
             return games
         
         for item in items:
-            try:
-                # Try to find the link
-                link = item.locator("a.cover, a.picture, a[href*='/en/']").first
-                if await link.count() == 0: continue
-                
-                href = await link.get_attribute("href")
-                if not href: continue
-                
-                if href.startswith("/"):
-                    href = f"https://www.instant-gaming.com{href}"
-                
-                # Skip non-game links
-                if not re.search(r'/\d+-', href):
-                    continue
-                
-                # Get title
-                title_elem = item.locator(".name .title, .title, h3").first
-                title = "Unknown"
-                if await title_elem.count() > 0:
-                    title = await title_elem.get_attribute("title")
-                    if not title:
-                        title = (await title_elem.inner_text()).strip()
-                
-                # Skip gift cards and non-games
-                skip_keywords = ['gift card', 'points', 'gems', 'credits', 'wallet', 'season pass']
-                if any(skip in title.lower() for skip in skip_keywords):
-                    continue
-                
-                games.append({"url": href, "title": title, "page": page_num})
-                
-            except Exception as e:
+            href = item.get("href")
+            if not href: continue
+            
+            if href.startswith("/"):
+                href = f"https://www.instant-gaming.com{href}"
+            
+            # Skip non-game links
+            if not PRODUCT_ID_RE.search(href):
+                continue
+            
+            title = item.get("title") or "Unknown"
+            
+            # Skip gift cards and non-games
+            if SKIP_TITLE_RE.search(title):
                 continue
+            
+            games.append({"url": href, "title": title, "page": page_num})
         
         print(f"[Search Page {page_num}] ✓ Found {len(games)} games", flush=True)
         
@@ -337,8 +321,8 @@ async def scrape_search_page(page, page_num, search_query=""):
     
     return games
 
-async def scrape_category_pages(browser, max_concurrent=10):
-    """Scrape games from multiple category pages"""
+async def scrape_category_pages(page):
+    """Scrape games from multiple category pages on `page`"""
     
     categories = [
         "https://www.instant-gaming.com/en/search/?type%5B%5D=steam",
@@ -354,71 +338,73 @@ async def scrape_category_pages(browser, max_concurrent=10):
         "https://www.instant-gaming.com/en/search/?sort_by=release_date",
     ]
     
-    all_games = []
-    seen_urls = set()
+    # Insertion-ordered dict keyed by URL doubles as the dedupe set
+    unique_games = {}
     
     print("\n🎮 Phase 1A: Scraping from multiple categories...", flush=True)
     
+    # Each listing URL is loaded exactly once
     for category_url in categories:
-        context = await browser.new_context(
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            viewport={'width': 1920, 'height': 1080}
-        )
-        page = await context.new_page()
-        
         try:
             # Get first 3 pages from each category
-            for page_num in range(1, 4):
-                games = await scrape_search_page(page, page_num, "")
+            for page_num, page_url in listing_page_urls(category_url, 3):
+                games = await scrape_search_page(page, page_num, page_url)
                 
                 for game in games:
-                    if game['url'] not in seen_urls:
-                        seen_urls.add(game['url'])
-                        all_games.append(game)
-                
-                await asyncio.sleep(1)  # Be polite
+                    unique_games.setdefault(game['url'], game)
                 
         except Exception as e:
             print(f"Error scraping category {category_url[:50]}: {e}", flush=True)
-        finally:
-            await context.close()
     
-    return all_games
+    return list(unique_games.values())
 
-async def scrape_game_worker(game_data, browser, download_media):
-    """Worker function to scrape a single game"""
-    context = await browser.new_context(
-        user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-        viewport={'width': 1920, 'height': 1080}
-    )
-    page = await context.new_page()
+async def scrape_game_worker(game_data, page_pool, download_media):
+    """Worker function to scrape a single game on a page borrowed from the pool"""
+    page = await page_pool.get()
     
     try:
-        details = await scrape_game_details(page, game_data['url'], game_data['title'], download_media)
-        print(f"✓ [{game_data.get('index', '?')}] {game_data['title'][:60]}", flush=True)
-        return details
+        details = await scrape_game_details(page, game_data['url'], game_data['title'])
     except Exception as e:
         print(f"✗ [{game_data.get('index', '?')}] {game_data['title']}: {e}", flush=True)
         return None
     finally:
-        await context.close()
+        # The tab goes back before downloading so the next game can load meanwhile
+        page_pool.put_nowait(page)
+    
+    if download_media:
+        await download_game_media(details)
+    print(f"✓ [{game_data.get('index', '?')}] {game_data['title'][:60]}", flush=True)
+    return details
 
-async def run_scraper(max_games, download_media, max_concurrent=10):
-    """Main scraper with async concurrency"""
+async def run_scraper(max_games, download_media, max_concurrent=10, browser=None):
+    """Main scraper with async concurrency.
+    
+    Pass an already-launched Playwright browser to share it with other scrapers;
+    otherwise one is launched and closed here.
+    """
+    if browser is None:
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True, args=CHROMIUM_ARGS, executable_path=CHROMIUM_PATH)
+            try:
+                return await run_scraper(max_games, download_media, max_concurrent, browser)
+            finally:
+                await browser.close()
+    
     print("\n" + "="*70)
     print("INSTANT GAMING SCRAPER - SEARCH-BASED VERSION")
     print("="*70 + "\n")
     
     os.makedirs("scraped_data", exist_ok=True)
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        
-        # PHASE 1: Collect game URLs from categories
-        print(f"PHASE 1: Collecting game URLs (Target: {max_games})")
-        print("="*70)
-        
-        all_games = await scrape_category_pages(browser, max_concurrent)
+    # PHASE 1: Collect game URLs from categories
+    print(f"PHASE 1: Collecting game URLs (Target: {max_games})")
+    print("="*70)
+    
+    # One listing tab serves both the category and the general search passes
+    listing_context = await new_context(browser)
+    try:
+        listing_page = await listing_context.new_page()
+        all_games = await scrape_category_pages(listing_page)
         
         print(f"\n✓ Collected {len(all_games)} unique games from categories", flush=True)
         
@@ -427,126 +413,123 @@ async def run_scraper(max_games, download_media, max_concurrent=10):
             print(f"\n🎮 Phase 1B: Scraping general search pages to reach {max_games} games...", flush=True)
             
             pages_needed = ((max_games - len(all_games)) // 30) + 5
-            seen_urls = {g['url'] for g in all_games}
-            
-            context = await browser.new_context(
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                viewport={'width': 1920, 'height': 1080}
-            )
-            page = await context.new_page()
+            unique_games = {g['url']: g for g in all_games}
             
-            for page_num in range(1, pages_needed + 1):
-                games = await scrape_search_page(page, page_num, "")
+            for page_num, page_url in listing_page_urls(SEARCH_URL, pages_needed):
+                games = await scrape_search_page(listing_page, page_num, page_url)
                 
                 for game in games:
-                    if game['url'] not in seen_urls:
-                        seen_urls.add(game['url'])
-                        all_games.append(game)
+                    unique_games.setdefault(game['url'], game)
                 
-                if len(all_games) >= max_games:
+                if len(unique_games) >= max_games:
                     break
-                
-                await asyncio.sleep(1)
             
-            await context.close()
-        
-        print(f"\n✓ Total unique games collected: {len(all_games)}", flush=True)
-        print(f"✓ Will scrape {min(len(all_games), max_games)} games", flush=True)
-        
-        if not all_games:
-            print("✗ No games found!", flush=True)
-            await browser.close()
-            return None
-        
-        # Limit to max_games
-        games_to_scrape = all_games[:max_games]
-        
-        # PHASE 2: Scrape each game concurrently
-        print(f"\nPHASE 2: Scraping game details ({len(games_to_scrape)} games)")
-        print("="*70 + "\n")
-        
-        all_results = []
-        
-        # Add index for progress tracking
-        for idx, game in enumerate(games_to_scrape, 1):
-            game['index'] = f"{idx}/{len(games_to_scrape)}"
+            all_games = list(unique_games.values())
+    finally:
+        await listing_context.close()
+    
+    print(f"\n✓ Total unique games collected: {len(all_games)}", flush=True)
+    print(f"✓ Will scrape {min(len(all_games), max_games)} games", flush=True)
+    
+    if not all_games:
+        print("✗ No games found!", flush=True)
+        return None
+    
+    # Limit to max_games
+    games_to_scrape = all_games[:max_games]
+    
+    # PHASE 2: Scrape each game concurrently
+    print(f"\nPHASE 2: Scraping game details ({len(games_to_scrape)} games)")
+    print("="*70 + "\n")
+    
+    completed = 0
+    
+    # Add index for progress tracking
+    for idx, game in enumerate(games_to_scrape, 1):
+        game['index'] = f"{idx}/{len(games_to_scrape)}"
+    
+    # Open one tab per concurrent slot up front and reuse them for every game
+    detail_context = await new_context(browser)
+    try:
+        page_pool = asyncio.Queue()
+        for _ in range(max_concurrent):
+            page_pool.put_nowait(await detail_context.new_page())
         
         # Create tasks for all games
         tasks = []
         for game in games_to_scrape:
-            tasks.append(scrape_game_worker(game, browser, download_media))
+            tasks.append(scrape_game_worker(game, page_pool, download_media))
         
-        # Run with concurrency limit
-        completed = 0
-        for i in range(0, len(tasks), max_concurrent):
-            batch = tasks[i:i+max_concurrent]
-            results = await asyncio.gather(*batch, return_exceptions=True)
+        # Stream each row to disk as it completes so a crash keeps prior work
+        with open(OUTPUT_CSV, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS, extrasaction='ignore')
+            writer.writeheader()
             
-            for result in results:
-                if isinstance(result, Exception):
-                    print(f"Error in game worker: {result}", flush=True)
+            # The page pool caps concurrency; a slow game no longer holds up a whole batch
+            for next_result in asyncio.as_completed(tasks):
+                try:
+                    result = await next_result
+                except Exception as e:
+                    print(f"Error in game worker: {e}", flush=True)
                     continue
-                    
+                
                 if result:
-                    all_results.append(result)
+                    writer.writerow(csv_row(result))
                     completed += 1
-                    
-                    # Save backup every 50 games
-                    if completed % 50 == 0:
-                        temp_df = pd.DataFrame(all_results)
-                        for col in ['screenshots', 'user_tags', 'game_features', 'editions']:
-                            if col in temp_df.columns:
-                                temp_df[col] = temp_df[col].apply(lambda x: '|'.join(x) if isinstance(x, list) and x else 'N/A')
-                        temp_df.to_csv("scraped_data/instant_gaming_backup.csv", index=False, encoding='utf-8-sig')
-                        print(f"\n💾 Backup saved: {completed} games\n", flush=True)
-        
-        await browser.close()
-        
-        # Save final results
-        df = pd.DataFrame(all_results)
-        
-        for col in ['screenshots', 'user_tags', 'game_features', 'editions']:
-            if col in df.columns:
-                df[col] = df[col].apply(lambda x: '|'.join(x) if isinstance(x, list) and x else 'N/A')
-        
-        df.to_csv("scraped_data/instant_gaming_data.csv", index=False, encoding='utf-8-sig')
-        
-        print("\n" + "="*70)
-        print(f"✓ SCRAPING COMPLETE!")
-        print(f"  Successfully scraped: {len(all_results)} games")
-        print("  CSV: scraped_data/instant_gaming_data.csv")
-        print("="*70 + "\n")
-        
-        print("DATA QUALITY:")
-        for col in ['current_price', 'developer', 'genre', 'description', 'ig_rating']:
-            if col in df.columns:
-                non_na = len(df[df[col] != 'N/A'])
-                print(f"  {col}: {non_na}/{len(df)} ({non_na/len(df)*100:.1f}%)")
-        
-        return df
+                    if completed % max_concurrent == 0:
+                        f.flush()
+    finally:
+        await detail_context.close()
+    
+    # Read back only for the quality report / return value - plain rows, no DataFrame
+    with open(OUTPUT_CSV, newline='', encoding='utf-8-sig') as f:
+        rows = list(csv.DictReader(f))
+    total = len(rows)
+    
+    print("\n" + "="*70)
+    print(f"✓ SCRAPING COMPLETE!")
+    print(f"  Successfully scraped: {completed} games")
+    print(f"  CSV: {OUTPUT_CSV}")
+    print("="*70 + "\n")
+    
+    print("DATA QUALITY:")
+    for col in ['current_price', 'developer', 'genre', 'description', 'ig_rating']:
+        if total:
+            non_na = sum(1 for r in rows if r[col] != 'N/A')
+            print(f"  {col}: {non_na}/{total} ({non_na/total*100:.1f}%)")
+    
+    return rows
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Instant Gaming Scraper - Search-Based')
     parser.add_argument('--max-games', type=int, default=700, help='Max games to scrape (default: 700)')
     parser.add_argument('--no-media', action='store_true', help='Skip downloading media')
     parser.add_argument('--concurrent', type=int, default=10, help='Number of concurrent tasks (default: 10)')
+    parser.add_argument('--webp', action='store_true', help='Store downloaded images as WebP (requires Pillow)')
     
     args = parser.parse_args()
     
+    if args.webp and Image is None:
+        print("⚠️ Pillow not installed - images will be saved in their original format")
+    CONVERT_TO_WEBP = args.webp
+    
     print(f"\n{'='*70}\nCONFIGURATION\n{'='*70}")
     print(f"Max Games: {args.max_games}")
     print(f"Download Media: {not args.no_media}")
     print(f"Concurrent Tasks: {args.concurrent}")
+    print(f"WebP Images: {CONVERT_TO_WEBP and Image is not None}")
     print("="*70 + "\n")
     
-    df = asyncio.run(run_scraper(args.max_games, not args.no_media, args.concurrent))
+    rows = asyncio.run(run_scraper(args.max_games, not args.no_media, args.concurrent))
     
-    if df is not None:
+    if rows:
         print("\nSAMPLE DATA (first 5 rows):")
         print("="*70)
         cols = ['title', 'current_price', 'discount_percentage', 'genre', 'ig_rating']
-        print(df[cols].head(5).to_string(index=False))
+        for r in rows[:5]:
+            print("  " + " | ".join(r[c][:40] for c in cols))
 
 # Usage:
 # python instantgaming.py --max-games 700 --concurrent 15
-# python instantgaming.py --max-games 500 --concurrent 10 --no-media
\ No newline at end of file
+# python instantgaming.py --max-games 500 --concurrent 10 --no-media
+# python instantgaming.py --max-games 200 --webp  # Smaller image files (needs Pillow)
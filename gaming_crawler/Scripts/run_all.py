@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Run the async scrapers (GOG + Instant Gaming) back to back on one shared Chromium.
+With --steam-games, the Steam scraper (sync Playwright, its own process pool)
+runs in a separate process at the same time.
+"""
+
+import asyncio, argparse
+from multiprocessing import Process
+from playwright.async_api import async_playwright
+
+import gog_scraper
+import instantgaming
+import steam_scraper
+from common import CHROMIUM_PATH, CHROMIUM_ARGS
+
+async def run_all(gog_pages=11, ig_games=700, download_media=True, headless=True):
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=headless, args=CHROMIUM_ARGS, executable_path=CHROMIUM_PATH)
+        try:
+            await gog_scraper.scrape(pages=gog_pages, headless=headless,
+                                     download_media=download_media, browser=browser)
+            await instantgaming.run_scraper(ig_games, download_media, browser=browser)
+        finally:
+            await browser.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Run GOG + Instant Gaming on one browser')
+    parser.add_argument('--gog-pages', type=int, default=11, help='GOG catalog pages (default: 11)')
+    parser.add_argument('--ig-games', type=int, default=700, help='Instant Gaming max games (default: 700)')
+    parser.add_argument('--steam-games', type=int, default=0, help='Also scrape this many Steam games in parallel (default: 0)')
+    parser.add_argument('--steam-workers', type=int, default=5, help='Steam worker processes (default: 5)')
+    parser.add_argument('--no-media', action='store_true', help='Skip downloading media')
+    parser.add_argument('--no-headless', action='store_true', help='Show browser')
+    args = parser.parse_args()
+
+    # Steam's sync scraper gets its own process so it never competes with the event loop for the GIL
+    steam = None
+    if args.steam_games:
+        steam = Process(target=steam_scraper.scrape_steam_games,
+                        kwargs={'max_games': args.steam_games, 'num_workers': args.steam_workers,
+                                'download_media_files': not args.no_media})
+        steam.start()
+
+    try:
+        asyncio.run(run_all(args.gog_pages, args.ig_games, not args.no_media, not args.no_headless))
+    finally:
+        if steam:
+            steam.join()
+
+# Usage:
+# python run_all.py --gog-pages 5 --ig-games 200
+# python run_all.py --gog-pages 5 --ig-games 200 --steam-games 300
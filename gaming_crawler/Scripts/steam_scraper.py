@@ -1,39 +1,65 @@
-import pandas as pd
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
 import time
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock
-import requests
+import csv
+import multiprocessing.util
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 import re
 import json
 from typing import Optional, Dict, List
+from common import CHROMIUM_PATH, CHROMIUM_ARGS, SERVICE_WORKERS, API, SESSION, save_stream, safe_dirname, TRACKER_URL_RE
 
-data_lock = Lock()
-all_game_data = []
+# Optional: parse listing HTML in-process instead of handing it to the browser
+try:
+    import lxml.html
+except ImportError:
+    lxml = None
+
+STEAM_RATING_SCORES = {
+    'overwhelmingly positive': 95, 'very positive': 85, 'positive': 75,
+    'mostly positive': 70, 'mixed': 50, 'mostly negative': 30,
+    'negative': 25, 'very negative': 15, 'overwhelmingly negative': 5
+}
+# Longest label first so "very negative" is not read as "negative"
+STEAM_RATING_LABELS = sorted(STEAM_RATING_SCORES, key=len, reverse=True)
+REVIEW_PERCENT_RE = re.compile(r'(\d+)%')
+APP_ID_RE = re.compile(r'/app/(\d+)')
+
+# Page-source video patterns, compiled once. Embedded description clips come first;
+# the four store-trailer variants are fused so the HTML is scanned in one pass.
+EMBEDDED_VIDEO_RE = re.compile(
+    r'https://shared\.fastly\.steamstatic\.com/store_item_assets/steam/apps/\d+/extras/[^"\'<>\s]+\.webm')
+TRAILER_VIDEO_RE = re.compile(
+    r'https://video\.[^"\'<>\s]+/store_trailers/[^"\'<>\s]+/(?:movie480_vp9|movie_max_vp9|movie480)\.webm'
+    r'|https://cdn\.[^"\'<>\s]+/steam/apps/\d+/movie480\.webm')
+# Video files and trailer manifests the store page's players request while loading
+VIDEO_REQUEST_RE = re.compile(r'\.(?:webm|mp4|m3u8|mpd)(?:\?|$)', re.IGNORECASE)
+# Of those, only files that download as-is (checked with the query string removed)
+DIRECT_VIDEO_RE = re.compile(r'\.(?:webm|mp4)$', re.IGNORECASE)
+# Steam Deck / hardware promo clips that show up next to game trailers
+EXCLUDED_VIDEO_RE = re.compile(r'steamdeck|hardware', re.IGNORECASE)
 
 def convert_steam_rating_to_score(review_text):
     """Convert Steam's text ratings to numerical scores (0-100)."""
     if not review_text or review_text == "N/A":
         return None
     
-    review_lower = review_text.lower()
-    rating_map = {
-        'overwhelmingly positive': 95, 'very positive': 85, 'positive': 75,
-        'mostly positive': 70, 'mixed': 50, 'mostly negative': 30,
-        'negative': 25, 'very negative': 15, 'overwhelmingly negative': 5
-    }
+    # The tooltip leads with the label, e.g. "Very Positive<br>92% of the 1,234 user reviews..."
+    label = review_text.split('<br>', 1)[0].strip().lower()
+    if label in STEAM_RATING_SCORES:
+        return STEAM_RATING_SCORES[label]
     
-    for rating_text, score in rating_map.items():
+    review_lower = review_text.lower()
+    for rating_text in STEAM_RATING_LABELS:
         if rating_text in review_lower:
-            return score
+            return STEAM_RATING_SCORES[rating_text]
     return None
 
 def extract_review_percentage(review_text):
     """Extract the percentage from Steam's review tooltip."""
     if not review_text or review_text == "N/A":
         return None
-    match = re.search(r'(\d+)%', review_text)
+    match = REVIEW_PERCENT_RE.search(review_text)
     return int(match.group(1)) if match else None
 
 def convert_hls_to_direct_url(hls_url):
@@ -56,6 +82,90 @@ def convert_hls_to_direct_url(hls_url):
     except:
         return []
 
+# Resolved once at import instead of per game
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+OUTPUT_DIR = os.path.join(SCRIPT_DIR, "scraped_data")
+MEDIA_ROOT = os.path.join(OUTPUT_DIR, "steam_media")
+
+CSV_FIELDS = [
+    "title", "release_date", "original_price", "price", "discount_percentage",
+    "review_summary", "rating_score", "rating_percentage", "url", "platforms",
+    "genres", "developer", "publisher", "categories", "multiplayer", "singleplayer",
+    "system_requirements_windows", "header_image", "screenshots", "videos",
+    "downloaded_images", "downloaded_videos"
+]
+
+def csv_row(game):
+    """Row for the CSV: downloaded path lists become ', '-joined text instead of list reprs.
+    The lists themselves stay on the game so reports can just take their len()."""
+    row = dict(game)
+    for key in ("downloaded_images", "downloaded_videos"):
+        if isinstance(row.get(key), list):
+            row[key] = ", ".join(row[key]) or "N/A"
+    return row
+
+APPDETAILS_URL = "https://store.steampowered.com/api/appdetails"
+# Parallel downloads per game; kept small to stay polite to Steam's CDN
+MEDIA_DOWNLOAD_WORKERS = 6
+
+def app_id_from_url(url):
+    """Extract the numeric app id from a store URL."""
+    match = APP_ID_RE.search(url or "")
+    return match.group(1) if match else None
+
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+def fetch_app_details(app_id):
+    """Fetch details, screenshots and trailers from Steam's appdetails JSON API - no browser needed."""
+    if not app_id:
+        return None
+    try:
+        response = API.get(APPDETAILS_URL, params={'appids': app_id}, timeout=10)
+        if response.status_code != 200:
+            return None
+        entry = response.json().get(app_id) or {}
+        if not entry.get('success'):
+            return None
+        data = entry.get('data') or {}
+    except Exception:
+        return None
+    
+    screenshots = [s['path_full'] for s in data.get('screenshots', []) if s.get('path_full')][:10]
+    
+    videos = []
+    for movie in data.get('movies', [])[:3]:
+        url = (movie.get('webm') or {}).get('max') or (movie.get('mp4') or {}).get('max')
+        if not url and movie.get('hls_h264'):
+            url = next(iter(convert_hls_to_direct_url(movie['hls_h264'])), None)
+        if url:
+            videos.append(url)
+    
+    categories = [c['description'] for c in data.get('categories', []) if c.get('description')]
+    categories_lower = " ".join(categories).lower()
+    
+    # pc_requirements is an HTML snippet dict, or an empty list when missing
+    requirements = data.get('pc_requirements')
+    req_text = HTML_TAG_RE.sub(' ', requirements.get('minimum', '')) if isinstance(requirements, dict) else ''
+    req_text = " ".join(req_text.split())[:300]
+    
+    return {
+        "genres": ", ".join(g['description'] for g in data.get('genres', []) if g.get('description')) or "N/A",
+        "developer": ", ".join(data.get('developers') or []) or "N/A",
+        "publisher": ", ".join(data.get('publishers') or []) or "N/A",
+        "categories": ", ".join(categories[:10]) or "N/A",
+        "multiplayer": "Yes" if "multi" in categories_lower else "No",
+        "singleplayer": "Yes" if "single" in categories_lower else "No",
+        "system_requirements_windows": req_text or "N/A",
+        "header_image": data.get('header_image') or "N/A",
+        "screenshots": screenshots, "videos": videos
+    }
+
+def fetch_page_details(page_games, max_workers=4):
+    """Phase 2 prefetch: pull appdetails for every game on a listing page in parallel over HTTP."""
+    app_ids = [app_id_from_url(g["url"]) for g in page_games]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return dict(zip(app_ids, pool.map(fetch_app_details, app_ids)))
+
 def download_media(url, save_dir, filename):
     """Download media file from URL - handles HLS manifest conversion."""
     try:
@@ -69,63 +179,68 @@ def download_media(url, save_dir, filename):
             return filepath
         
         # Regular download for images and direct video files
-        response = requests.get(url, timeout=15, stream=True, headers={
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Referer': 'https://store.steampowered.com/'
-        })
-        
-        if response.status_code == 200:
-            filepath = os.path.join(save_dir, filename)
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-            
-            # Verify file was downloaded
-            if os.path.exists(filepath) and os.path.getsize(filepath) > 0:
-                return filepath
-            else:
-                print(f"   ⚠️ Downloaded file is empty")
+        with SESSION.get(url, timeout=15, stream=True,
+                         headers={'Referer': 'https://store.steampowered.com/'}) as response:
+            if response.status_code != 200:
+                print(f"   HTTP {response.status_code} for {filename}")
                 return None
-        else:
-            print(f"   HTTP {response.status_code} for {filename}")
-            return None
+            filepath = save_stream(response, os.path.join(save_dir, filename))
+        
+        # Verify file was downloaded
+        if os.path.getsize(filepath) > 0:
+            return filepath
+        print(f"   ⚠️ Downloaded file is empty")
+        return None
             
     except Exception as e:
         print(f"   Download error {filename}: {str(e)[:50]}")
     return None
 
+# What the age gate stores once passed; preset so mature store pages load directly
+AGE_GATE_COOKIES = [
+    {"name": name, "value": value, "domain": "store.steampowered.com", "path": "/"}
+    for name, value in (("birthtime", "631152001"), ("lastagecheckage", "1-0-1990"),
+                        ("wants_mature_content", "1"))
+]
+
 def handle_age_gate(page):
     """Handle Steam age verification gate - FAST version."""
     try:
         if page.locator(".agegate_birthday_selector").is_visible(timeout=500):
             page.select_option("#ageYear", "1990")
-            page.click("#age_gate_btn_continue")
-            page.wait_for_load_state("domcontentloaded", timeout=5000)
+            # The button reloads the store page; wait for that navigation, not the gate's
+            with page.expect_navigation(wait_until="domcontentloaded", timeout=5000):
+                page.click("#age_gate_btn_continue")
             return True
     except:
         pass
     return False
 
-def extract_video_urls(page, page_content: str) -> List[str]:
+# Runs each pattern (the *_VIDEO_RE sources, valid JS syntax too) over the serialised
+# DOM in the browser and returns the distinct matches per pattern, in page order
+PAGE_VIDEO_SCAN_JS = """
+patterns => {
+    const html = document.documentElement.outerHTML;
+    return patterns.map(p => [...new Set(Array.from(html.matchAll(new RegExp(p, "g")), m => m[0]))]);
+}
+"""
+
+def extract_video_urls(store: Dict, page) -> List[str]:
     """
     Extract game trailer URLs - ENHANCED VERSION from Selenium scraper.
-    Prioritizes direct video files over HLS manifests.
+    Prioritizes direct video files over HLS manifests. `store` is the STORE_PAGE_JS result
+    plus the video URLs the page requested; the page HTML is only scanned if neither gave
+    three videos.
     """
     video_urls = []
     
     try:
         # Method 0: Extract embedded videos from game description (BEST - actual video files!)
         try:
-            video_elements = page.locator("video source[src*='.webm'], video source[src*='.mp4']").all()
-            
-            for video_elem in video_elements[:3]:
-                try:
-                    video_url = video_elem.get_attribute("src")
-                    if video_url and 'store_item_assets' in video_url:
-                        video_urls.append(video_url)
-                        print(f"      ✓ Embedded video: {video_url[:80]}...")
-                except:
-                    continue
+            for video_url in store["embedded_videos"][:3]:
+                if video_url and 'store_item_assets' in video_url:
+                    video_urls.append(video_url)
+                    print(f"      ✓ Embedded video: {video_url[:80]}...")
             
             if video_urls:
                 print(f"      Found {len(video_urls)} embedded videos")
@@ -135,111 +250,90 @@ def extract_video_urls(page, page_content: str) -> List[str]:
         # Method 1: Parse data-props JSON for trailers
         if len(video_urls) < 3:
             try:
-                selectors = [
-                    ".gamehighlight_desktopcarousel[data-props]",
-                    "[data-featuretarget='gamehighlight-desktopcarousel'][data-props]",
-                    "div[data-props*='trailers']",
-                    "[class*='gamehighlight'][data-props]"
-                ]
-                
-                carousel = None
-                for selector in selectors:
-                    try:
-                        carousel = page.locator(selector).first
-                        if carousel.count() > 0:
-                            break
-                    except:
-                        continue
-                
-                if carousel and carousel.count() > 0:
-                    data_props = carousel.get_attribute("data-props")
+                data_props = store["data_props"]
+                if data_props:
+                    # Unescape HTML entities
+                    data_props = data_props.replace('&quot;', '"').replace('&amp;', '&').replace('\\/', '/')
                     
-                    if data_props:
-                        # Unescape HTML entities
-                        data_props = data_props.replace('&quot;', '"').replace('&amp;', '&').replace('\\/', '/')
-                        
-                        # Parse the JSON data
-                        data = json.loads(data_props)
-                        
-                        # Extract trailer URLs
-                        if "trailers" in data and isinstance(data["trailers"], list):
-                            for trailer in data["trailers"][:3]:
-                                # Get HLS manifest and convert to direct URLs
-                                if "hlsManifest" in trailer and trailer["hlsManifest"]:
-                                    hls_url = trailer["hlsManifest"].replace('\\/', '/')
-                                    
-                                    # Get all possible direct video URLs
-                                    possible_urls = convert_hls_to_direct_url(hls_url)
+                    # Parse the JSON data
+                    data = json.loads(data_props)
+                    
+                    # Extract trailer URLs
+                    if "trailers" in data and isinstance(data["trailers"], list):
+                        for trailer in data["trailers"][:3]:
+                            # Get HLS manifest and convert to direct URLs
+                            if "hlsManifest" in trailer and trailer["hlsManifest"]:
+                                hls_url = trailer["hlsManifest"].replace('\\/', '/')
+                                
+                                # Get all possible direct video URLs
+                                possible_urls = convert_hls_to_direct_url(hls_url)
+                                
+                                # Add the first converted URL (not the HLS manifest)
+                                for url in possible_urls:
+                                    if not url.endswith('.m3u8'):
+                                        video_urls.append(url)
+                                        print(f"      ✓ Converted HLS: {url[:80]}...")
+                                        break
+                                else:
+                                    # If no direct URL, keep HLS as last resort
+                                    video_urls.append(hls_url)
+                                    print(f"      HLS manifest: {hls_url[:80]}...")
                                     
-                                    # Add the first converted URL (not the HLS manifest)
-                                    for url in possible_urls:
-                                        if not url.endswith('.m3u8'):
-                                            video_urls.append(url)
-                                            print(f"      ✓ Converted HLS: {url[:80]}...")
-                                            break
-                                    else:
-                                        # If no direct URL, keep HLS as last resort
-                                        video_urls.append(hls_url)
-                                        print(f"      HLS manifest: {hls_url[:80]}...")
-                                        
-                                # Fallback to DASH manifest
-                                elif "dashManifests" in trailer and trailer["dashManifests"] and len(trailer["dashManifests"]) > 0:
-                                    url = trailer["dashManifests"][0].replace('\\/', '/')
-                                    video_urls.append(url)
-                                    print(f"      DASH: {url[:80]}...")
-                        
-                        if len(video_urls) > 0:
-                            print(f"      Found {len(video_urls)} from data-props")
+                            # Fallback to DASH manifest
+                            elif "dashManifests" in trailer and trailer["dashManifests"] and len(trailer["dashManifests"]) > 0:
+                                url = trailer["dashManifests"][0].replace('\\/', '/')
+                                video_urls.append(url)
+                                print(f"      DASH: {url[:80]}...")
                     
+                    if len(video_urls) > 0:
+                        print(f"      Found {len(video_urls)} from data-props")
+                
             except json.JSONDecodeError as e:
                 pass
             except Exception as e:
                 pass
         
-        # Method 2: Regex search for embedded video URLs in page source
+        # Method 2: Video URLs the players requested during page load (blocked, but seen)
+        if len(video_urls) < 3:
+            for url in store.get("network_videos", []):
+                path = url.split('?', 1)[0]
+                if path.lower().endswith('.m3u8') and '/hls_' in path:
+                    # The master playlist and each variant all convert to the same files
+                    url = convert_hls_to_direct_url(path)[0]
+                elif not DIRECT_VIDEO_RE.search(path):
+                    continue  # DASH (.mpd) and other manifests are not video files
+                if url in video_urls or EXCLUDED_VIDEO_RE.search(url):
+                    continue
+                video_urls.append(url)
+                print(f"      ✓ Network: {url[:80]}...")
+                if len(video_urls) >= 3:
+                    break
+        
+        # Method 3: Regex search for embedded video URLs in page source
         if len(video_urls) < 3:
             try:
-                # Pattern for embedded game description videos (direct files!)
-                embedded_pattern = r'https://shared\.fastly\.steamstatic\.com/store_item_assets/steam/apps/\d+/extras/[^"\'<>\s]+\.webm'
-                embedded_matches = re.findall(embedded_pattern, page_content)
+                # Scanned inside the page: only the matches cross over, not MBs of HTML
+                found = page.evaluate(PAGE_VIDEO_SCAN_JS, [EMBEDDED_VIDEO_RE.pattern, TRAILER_VIDEO_RE.pattern])
                 
-                for url in embedded_matches[:3]:
-                    if url not in video_urls:
+                # Embedded game description videos (direct files!), then store trailers
+                for label, urls in zip(("embedded", "trailer"), found):
+                    for url in urls:
+                        if url in video_urls or EXCLUDED_VIDEO_RE.search(url):
+                            continue
                         video_urls.append(url)
-                        print(f"      ✓ Regex embedded: {url[:80]}...")
+                        print(f"      ✓ Regex {label}: {url[:80]}...")
                         if len(video_urls) >= 3:
                             break
-                
-                # Also search for direct trailer videos
-                video_patterns = [
-                    r'https://video\.[^"\'<>\s]+/store_trailers/[^"\'<>\s]+/movie480_vp9\.webm',
-                    r'https://video\.[^"\'<>\s]+/store_trailers/[^"\'<>\s]+/movie_max_vp9\.webm',
-                    r'https://video\.[^"\'<>\s]+/store_trailers/[^"\'<>\s]+/movie480\.webm',
-                    r'https://cdn\.[^"\'<>\s]+/steam/apps/\d+/movie480\.webm',
-                ]
-                
-                exclude_keywords = ['steamdeck', 'hardware']
-                
-                for pattern in video_patterns:
-                    matches = re.findall(pattern, page_content)
-                    for url in matches:
-                        if not any(kw in url.lower() for kw in exclude_keywords):
-                            if url not in video_urls:
-                                video_urls.append(url)
-                                print(f"      ✓ Regex trailer: {url[:80]}...")
-                                if len(video_urls) >= 3:
-                                    break
                     if len(video_urls) >= 3:
                         break
                 
             except Exception as e:
                 pass
         
-        # Method 3: Construct URLs from app ID as last resort
+        # Method 4: Construct URLs from app ID as last resort
         if len(video_urls) == 0:
             try:
-                current_url = page.url
-                app_id_match = re.search(r'/app/(\d+)/', current_url)
+                app_id_match = APP_ID_RE.search(page.url)
                 
                 if app_id_match:
                     app_id = app_id_match.group(1)
@@ -257,24 +351,44 @@ def extract_video_urls(page, page_content: str) -> List[str]:
     except Exception as e:
         print(f"   Fatal video error: {e}")
     
-    # Return unique URLs, limit to 3
-    unique_urls = []
-    for url in video_urls:
-        if url not in unique_urls:
-            unique_urls.append(url)
-    
-    return unique_urls[:3]
+    # Return unique URLs (first occurrence wins), limit to 3
+    return list(dict.fromkeys(video_urls))[:3]
 
-def scrape_game_details(page, game_url, game_title, download_media_files=True):
-    """Scrape detailed game information - ENHANCED with better video extraction."""
-    # ADDED developer and publisher to default dictionary
-    details = {
-        "genres": "N/A", "developer": "N/A", "publisher": "N/A", 
-        "categories": "N/A", "multiplayer": "No", "singleplayer": "No",
-        "system_requirements_windows": "N/A", "header_image": "N/A",
-        "screenshots": "N/A", "videos": "N/A",
-        "downloaded_images": [], "downloaded_videos": []
-    }
+# Everything scrape_store_page and extract_video_urls read from the DOM, in one round trip
+STORE_PAGE_JS = """
+() => {
+    const texts = sel => Array.from(document.querySelectorAll(sel), e => e.innerText.trim());
+    const attrs = (sel, a) => Array.from(document.querySelectorAll(sel), e => e.getAttribute(a));
+    const req = document.querySelector(".game_area_sys_req_leftCol, .sysreq_contents");
+    const header = document.querySelector(".game_header_image_full");
+    const carousel = [
+        ".gamehighlight_desktopcarousel[data-props]",
+        "[data-featuretarget='gamehighlight-desktopcarousel'][data-props]",
+        "div[data-props*='trailers']",
+        "[class*='gamehighlight'][data-props]"
+    ].map(sel => document.querySelector(sel)).find(e => e);
+    return {
+        grid: texts("#appHeaderGridContainer .grid_content"),
+        genres: texts(".details_block a[href*='genre']"),
+        categories: texts(".game_area_features_list_ctn a"),
+        requirements: req ? req.innerText.trim() : null,
+        header: header ? header.getAttribute("src") : null,
+        screenshots: attrs(".highlight_screenshot img, .screenshot_holder img", "src"),
+        embedded_videos: attrs("video source[src*='.webm'], video source[src*='.mp4']", "src"),
+        data_props: carousel ? carousel.getAttribute("data-props") : null
+    };
+}
+"""
+
+def scrape_store_page(page, game_url, details):
+    """Fill `details` from the rendered store page - fallback when appdetails has no media."""
+    # Trailer players fetch their files/manifests as the page loads; the route handler
+    # aborts them, but their URLs are the video URLs without scanning the HTML
+    network_videos = []
+    def on_request(request):
+        if VIDEO_REQUEST_RE.search(request.url):
+            network_videos.append(request.url)
+    page.on("request", on_request)
     
     try:
         # Navigate with shorter timeout
@@ -287,320 +401,434 @@ def scrape_game_details(page, game_url, game_title, download_media_files=True):
         except:
             pass
         
-        # Wait a bit for videos to load
-        time.sleep(2)
-        
-        # Get page content once for regex extraction
-        page_content = page.content()
-        
-        # === FAST DATA EXTRACTION ===
-        
-        # Developer and Publisher Extraction
-        try:
-            # Targeting the specific ID you provided: appHeaderGridContainer
-            grid_container = page.locator("#appHeaderGridContainer")
-            if grid_container.count() > 0:
-                # Developer is usually the first content block in the grid
-                dev_text = grid_container.locator(".grid_content").first.inner_text()
-                details["developer"] = dev_text.strip() if dev_text else "N/A"
-                
-                # Publisher is usually the second content block in the grid
-                pub_text = grid_container.locator(".grid_content").nth(1).inner_text()
-                details["publisher"] = pub_text.strip() if pub_text else "N/A"
-        except:
-            pass
-
-        # Genres - single query
-        try:
-            genres = page.locator(".details_block a[href*='genre']").all_inner_texts()
-            details["genres"] = ", ".join([g.strip() for g in genres if g.strip()]) or "N/A"
-        except:
-            pass
-        
-        # Categories + Multiplayer detection
-        try:
-            categories = []
-            cats = page.locator(".game_area_features_list_ctn a").all_inner_texts()
-            for cat_text in cats:
-                if cat_text:
-                    categories.append(cat_text)
-                    cat_lower = cat_text.lower()
-                    if "multi" in cat_lower:
-                        details["multiplayer"] = "Yes"
-                    if "single" in cat_lower:
-                        details["singleplayer"] = "Yes"
-            details["categories"] = ", ".join(set(categories)[:10]) if categories else "N/A"
-        except:
-            pass
-        
-        # System Requirements (Windows only, simplified)
-        try:
-            req = page.locator(".game_area_sys_req_leftCol, .sysreq_contents").first
-            if req.is_visible(timeout=1000):
-                req_text = req.inner_text(timeout=500).strip()[:300]
-                if req_text:
-                    details["system_requirements_windows"] = req_text
-        except:
-            pass
-        
-        # === MEDIA EXTRACTION ===
-        
-        # Header image
+        # Trailers are injected late
         try:
-            header = page.locator(".game_header_image_full").first
-            if header.is_visible(timeout=1000):
-                details["header_image"] = header.get_attribute("src")
-        except:
+            page.wait_for_selector("[data-props*='trailers'], video source", state="attached", timeout=2000)
+        except PlaywrightTimeout:
             pass
         
-        # Screenshots
-        try:
-            screenshot_imgs = page.locator(".highlight_screenshot img, .screenshot_holder img").all()
-            urls = []
-            for img in screenshot_imgs[:10]:
-                src = img.get_attribute("src")
-                if src and "steam" in src:
-                    full_url = src.replace("116x65", "1920x1080").replace(".116x65", "")
-                    urls.append(full_url)
-            if urls:
-                details["screenshots"] = ", ".join(urls)
-        except:
-            pass
-        
-        # Videos - ENHANCED extraction using Selenium method
-        try:
-            video_urls = extract_video_urls(page, page_content)
-            if video_urls:
-                details["videos"] = ", ".join(video_urls)
-        except Exception as e:
-            print(f"   Video extraction error: {e}")
+        # === FAST DATA EXTRACTION === (every field in one evaluate)
+        store = page.evaluate(STORE_PAGE_JS)
+    finally:
+        page.remove_listener("request", on_request)
+    store["network_videos"] = network_videos
+    
+    # Developer is the first content block in #appHeaderGridContainer, publisher the second
+    if store["grid"]:
+        details["developer"] = store["grid"][0] or "N/A"
+        if len(store["grid"]) > 1:
+            details["publisher"] = store["grid"][1] or "N/A"
+    
+    details["genres"] = ", ".join(g for g in store["genres"] if g) or "N/A"
+    
+    # Categories + Multiplayer detection
+    categories = list(dict.fromkeys(c for c in store["categories"] if c))
+    categories_lower = " ".join(categories).lower()
+    if "multi" in categories_lower:
+        details["multiplayer"] = "Yes"
+    if "single" in categories_lower:
+        details["singleplayer"] = "Yes"
+    details["categories"] = ", ".join(categories[:10]) or "N/A"
+    
+    # System Requirements (Windows only, simplified)
+    if store["requirements"]:
+        details["system_requirements_windows"] = store["requirements"][:300]
+    
+    # === MEDIA EXTRACTION ===
+    
+    if store["header"]:
+        details["header_image"] = store["header"]
+    
+    # Screenshots - thumbnails rewritten to full size
+    urls = [src.replace("116x65", "1920x1080").replace(".116x65", "")
+            for src in store["screenshots"][:10] if src and "steam" in src]
+    if urls:
+        details["screenshots"] = ", ".join(urls)
+    
+    # Videos - ENHANCED page extraction
+    try:
+        video_urls = extract_video_urls(store, page)
+        if video_urls:
+            details["videos"] = ", ".join(video_urls)
+    except Exception as e:
+        print(f"   Video extraction error: {e}")
+
+def queue_media_downloads(details, game_title, pool):
+    """Submit a game's header, screenshots (max 5) and videos (max 3) to `pool`.
+    
+    Returns a callable that waits for them and fills downloaded_images/videos,
+    so callers can keep scraping while the files arrive.
+    """
+    if details["screenshots"] == "N/A" and details["videos"] == "N/A":
+        return lambda: None
+    
+    safe_title = safe_dirname(game_title)
+    game_media_dir = os.path.join(MEDIA_ROOT, safe_title)
+    try:
+        os.mkdir(game_media_dir)
+    except FileExistsError:
+        pass
+    
+    image_jobs = []
+    if details["header_image"] != "N/A":
+        image_jobs.append((details["header_image"], "header.jpg"))
+    if details["screenshots"] != "N/A":
+        image_jobs += [(url, f"screenshot_{idx+1}.jpg")
+                       for idx, url in enumerate(details["screenshots"].split(", ")[:5])]
+    
+    video_jobs = []
+    if details["videos"] != "N/A":
+        for idx, video_url in enumerate(details["videos"].split(", ")[:3]):
+            # Determine file extension
+            if '.m3u8' in video_url or '.mpd' in video_url:
+                ext = ".txt"  # HLS manifest info
+            elif '.mp4' in video_url:
+                ext = ".mp4"
+            else:
+                ext = ".webm"
+            video_jobs.append((video_url, f"video_{idx+1}{ext}"))
+    
+    # map() submits every job immediately; results are only awaited in finish()
+    fetch = lambda job: download_media(job[0], game_media_dir, job[1])
+    images = pool.map(fetch, image_jobs)
+    videos = pool.map(fetch, video_jobs)
+    
+    def finish():
+        details["downloaded_images"] = [path for path in images if path]
+        details["downloaded_videos"] = [path for path in videos if path]
+        if details["downloaded_videos"]:
+            print(f"      ✓ {len(details['downloaded_videos'])} video(s) downloaded")
+    return finish
+
+def scrape_game_details(page, game_url, game_title, download_media_files=True, api_details=None):
+    """Scrape detailed game information - ENHANCED with better video extraction.
+    
+    `api_details` is the prefetched appdetails result; the store page is only
+    rendered when it is missing or has no screenshots/videos.
+    """
+    # ADDED developer and publisher to default dictionary
+    details = {
+        "genres": "N/A", "developer": "N/A", "publisher": "N/A", 
+        "categories": "N/A", "multiplayer": "No", "singleplayer": "No",
+        "system_requirements_windows": "N/A", "header_image": "N/A",
+        "screenshots": "N/A", "videos": "N/A",
+        "downloaded_images": [], "downloaded_videos": []
+    }
+    
+    try:
+        if api_details and (api_details["screenshots"] or api_details["videos"]):
+            details.update(api_details)
+            details["screenshots"] = ", ".join(api_details["screenshots"]) or "N/A"
+            details["videos"] = ", ".join(api_details["videos"]) or "N/A"
+        else:
+            scrape_store_page(page, game_url, details)
         
         # === DOWNLOAD MEDIA ===
-        if download_media_files and (details["screenshots"] != "N/A" or details["videos"] != "N/A"):
-            safe_title = re.sub(r'[<>:"/\\|?*]', '', game_title)[:50]
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            game_media_dir = os.path.join(script_dir, "scraped_data", "steam_media", safe_title)
-            os.makedirs(game_media_dir, exist_ok=True)
-            
-            # Download header
-            if details["header_image"] != "N/A":
-                downloaded = download_media(details["header_image"], game_media_dir, "header.jpg")
-                if downloaded:
-                    details["downloaded_images"].append(downloaded)
-            
-            # Download screenshots (max 5)
-            if details["screenshots"] != "N/A":
-                screenshot_urls = details["screenshots"].split(", ")
-                for idx, img_url in enumerate(screenshot_urls[:5]):
-                    downloaded = download_media(img_url, game_media_dir, f"screenshot_{idx+1}.jpg")
-                    if downloaded:
-                        details["downloaded_images"].append(downloaded)
-            
-            # Download videos (max 3)
-            if details["videos"] != "N/A":
-                video_urls = details["videos"].split(", ")
-                for idx, video_url in enumerate(video_urls[:3]):
-                    try:
-                        # Determine file extension
-                        if '.m3u8' in video_url or '.mpd' in video_url:
-                            ext = ".txt"  # HLS manifest info
-                        elif '.mp4' in video_url:
-                            ext = ".mp4"
-                        else:
-                            ext = ".webm"
-                        
-                        downloaded = download_media(video_url, game_media_dir, f"video_{idx+1}{ext}")
-                        if downloaded:
-                            details["downloaded_videos"].append(downloaded)
-                            print(f"      ✓ Video {idx+1} downloaded")
-                    except Exception as e:
-                        print(f"      Failed to download video {idx+1}: {e}")
+        if download_media_files:
+            with ThreadPoolExecutor(max_workers=MEDIA_DOWNLOAD_WORKERS) as pool:
+                queue_media_downloads(details, game_title, pool)()
         
     except Exception as e:
         print(f"   Error details {game_title[:30]}: {str(e)[:50]}")
     
     return details
 
-def scrape_game_from_search(game_element):
-    """Extract game data from search result element - FAST VERSION."""
+# One round trip per results page: every per-row field, null when absent
+SEARCH_ROWS_JS = """
+rows => rows.map(row => {
+    const text = sel => { const e = row.querySelector(sel); return e ? e.innerText.trim() : null; };
+    const review = row.querySelector(".search_review_summary");
+    return {
+        title: text(".title"),
+        release: text(".search_released"),
+        discount_pct: text(".discount_block .discount_pct"),
+        original_price: text(".discount_block .discount_original_price"),
+        final_price: text(".discount_block .discount_final_price"),
+        search_price: text(".search_price"),
+        review: review ? review.getAttribute("data-tooltip-html") : null,
+        url: row.getAttribute("href"),
+        platforms: Array.from(row.querySelectorAll(".platform_img")).map(e => e.className).join(" ")
+    };
+})
+"""
+
+SEARCH_RESULTS_URL = "https://store.steampowered.com/search/results/"
+SEARCH_PAGE_SIZE = 25
+SEARCH_MIN_INTERVAL = 1.0  # seconds between one worker's listing requests
+
+# Parses the results_html fragment in a detached document (nothing loads or renders)
+SEARCH_HTML_JS = f"""
+html => {{
+    const doc = new DOMParser().parseFromString(html, "text/html");
+    return ({SEARCH_ROWS_JS.strip()})(Array.from(doc.querySelectorAll("a.search_result_row")));
+}}
+"""
+
+def _xpath_class(name):
+    """XPath test for an element carrying CSS class `name`"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+if lxml:
+    # The same fields as SEARCH_ROWS_JS; compiled once, run per row
+    SEARCH_ROW_XPATH = lxml.etree.XPath(f"//a[{_xpath_class('search_result_row')}]")
+    SEARCH_TEXT_XPATHS = {
+        field: lxml.etree.XPath("." + "".join(f"//*[{_xpath_class(c)}]" for c in classes))
+        for field, classes in {
+            "title": ("title",), "release": ("search_released",),
+            "discount_pct": ("discount_block", "discount_pct"),
+            "original_price": ("discount_block", "discount_original_price"),
+            "final_price": ("discount_block", "discount_final_price"),
+            "search_price": ("search_price",),
+        }.items()
+    }
+    SEARCH_REVIEW_XPATH = lxml.etree.XPath(f".//*[{_xpath_class('search_review_summary')}]/@data-tooltip-html")
+    SEARCH_PLATFORM_XPATH = lxml.etree.XPath(f".//*[{_xpath_class('platform_img')}]/@class")
+
+def parse_search_rows(html):
+    """SEARCH_ROWS_JS records parsed from results_html with lxml (no browser round trip)."""
+    rows = []
+    for row in SEARCH_ROW_XPATH(lxml.html.fromstring(html)):
+        record = {}
+        for field, xpath in SEARCH_TEXT_XPATHS.items():
+            found = xpath(row)
+            record[field] = found[0].text_content().strip() if found else None
+        review = SEARCH_REVIEW_XPATH(row)
+        record["review"] = str(review[0]) if review else None
+        record["url"] = row.get("href")
+        record["platforms"] = " ".join(SEARCH_PLATFORM_XPATH(row))
+        rows.append(record)
+    return rows
+
+def fetch_search_rows(page, page_num):
+    """SEARCH_ROWS_JS records for one results page from Steam's infinite-scroll JSON - no navigation."""
+    response = API.get(SEARCH_RESULTS_URL, timeout=10, params={
+        'filter': 'topsellers', 'infinite': 1,
+        'start': (page_num - 1) * SEARCH_PAGE_SIZE, 'count': SEARCH_PAGE_SIZE
+    })
+    response.raise_for_status()
+    html = response.json().get('results_html')
+    if not html:
+        raise ValueError("empty results_html")
+    if lxml:
+        return parse_search_rows(html)
+    return page.evaluate(SEARCH_HTML_JS, html)
+
+def scrape_game_from_search(row):
+    """Build game data from one SEARCH_ROWS_JS record."""
     try:
-        # Get all text at once
-        title = game_element.locator(".title").inner_text(timeout=2000).strip()
-        
-        # Release date
-        release_date = "N/A"
-        try:
-            release_date = game_element.locator(".search_released").inner_text(timeout=500).strip()
-        except:
-            pass
+        title = row["title"]
+        if not title:
+            return None
         
         # Price info
-        price = discount_pct = original_price = "N/A"
-        try:
-            if game_element.locator(".discount_block").count() > 0:
-                discount_block = game_element.locator(".discount_block").first
-                try:
-                    discount_pct = discount_block.locator(".discount_pct").inner_text(timeout=300).strip()
-                except:
-                    pass
-                try:
-                    original_price = discount_block.locator(".discount_original_price").inner_text(timeout=300).strip()
-                except:
-                    pass
-                try:
-                    price = discount_block.locator(".discount_final_price").inner_text(timeout=300).strip()
-                except:
-                    pass
-        except:
-            pass
-        
+        price = row["final_price"] or "N/A"
         if price == "N/A":
-            try:
-                price_text = game_element.locator(".search_price").inner_text(timeout=500).strip()
-                price = "Free" if "Free" in price_text else (price_text if price_text else "N/A")
-            except:
-                pass
+            price_text = row["search_price"] or ""
+            price = "Free" if "Free" in price_text else (price_text if price_text else "N/A")
         
         # Reviews
-        review_summary_text = "N/A"
-        rating_score = None
-        rating_percentage = None
-        try:
-            if game_element.locator(".search_review_summary").count() > 0:
-                review_elem = game_element.locator(".search_review_summary").first
-                review_summary_text = review_elem.get_attribute("data-tooltip-html", timeout=300) or "N/A"
-                rating_score = convert_steam_rating_to_score(review_summary_text)
-                rating_percentage = extract_review_percentage(review_summary_text)
-        except:
-            pass
+        review_summary_text = row["review"] or "N/A"
+        rating_score = rating_percentage = None
+        if row["review"]:
+            rating_score = convert_steam_rating_to_score(review_summary_text)
+            rating_percentage = extract_review_percentage(review_summary_text)
         
-        # URL
-        game_url = "N/A"
-        try:
-            game_url = game_element.get_attribute("href", timeout=500)
-        except:
-            pass
-        
-        # Platforms
-        platforms = []
-        if game_element.locator(".platform_img.win").count() > 0:
-            platforms.append("Windows")
-        if game_element.locator(".platform_img.mac").count() > 0:
-            platforms.append("Mac")
-        if game_element.locator(".platform_img.linux").count() > 0:
-            platforms.append("Linux")
+        platform_classes = set(row["platforms"].split())
+        platforms = [name for cls, name in (("win", "Windows"), ("mac", "Mac"), ("linux", "Linux"))
+                     if cls in platform_classes]
         
         return {
-            "title": title, "release_date": release_date,
-            "original_price": original_price, "price": price,
-            "discount_percentage": discount_pct, "review_summary": review_summary_text,
+            "title": title, "release_date": row["release"] or "N/A",
+            "original_price": row["original_price"] or "N/A", "price": price,
+            "discount_percentage": row["discount_pct"] or "N/A", "review_summary": review_summary_text,
             "rating_score": rating_score, "rating_percentage": rating_percentage,
-            "url": game_url, "platforms": ", ".join(platforms) if platforms else "N/A"
+            "url": row["url"] or "N/A", "platforms": ", ".join(platforms) if platforms else "N/A"
         }
     except:
         return None
 
-def scrape_page_range(worker_id, start_page, end_page, scrape_details=True, download_media_files=True):
-    """Scrape a range of pages - OPTIMIZED VERSION."""
-    local_data = []
-    
-    with sync_playwright() as p:
-        browser = p.chromium.launch(
+# Thumbnails, fonts and video never need to load: only their URLs are read.
+# Images are also switched off in CHROMIUM_ARGS; "image" stays here as a backstop.
+# Stylesheets stay on because row text is read with innerText and the age gate
+# with is_visible, both of which follow CSS.
+STEAM_BLOCKED_TYPES = frozenset({"image", "font", "media"})
+
+def block_steam_resources(route):
+    """Sync Playwright route handler for search and store pages."""
+    if route.request.resource_type in STEAM_BLOCKED_TYPES or TRACKER_URL_RE.match(route.request.url):
+        route.abort()
+    else:
+        route.continue_()
+
+# Per-process browser: a pool worker keeps it alive across scrape_page_range jobs
+_worker_playwright = None
+_worker_browser = None
+_next_listing = 0.0  # earliest time this process may request its next search listing
+
+def close_worker_browser():
+    """Shut down this process's browser (runs when the pool worker exits)."""
+    global _worker_playwright, _worker_browser
+    try:
+        if _worker_browser:
+            _worker_browser.close()
+        if _worker_playwright:
+            _worker_playwright.stop()
+    except:
+        pass
+    _worker_playwright = _worker_browser = None
+
+def get_worker_browser():
+    """Launch Chromium once per process and hand back the same instance afterwards."""
+    global _worker_playwright, _worker_browser
+    if _worker_browser is None or not _worker_browser.is_connected():
+        if _worker_playwright is None:
+            _worker_playwright = sync_playwright().start()
+            multiprocessing.util.Finalize(None, close_worker_browser, exitpriority=10)
+        _worker_browser = _worker_playwright.chromium.launch(
             headless=True,
-            args=['--disable-blink-features=AutomationControlled', '--disable-dev-shm-usage']
-        )
-        context = browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+            args=CHROMIUM_ARGS,
+            executable_path=CHROMIUM_PATH
         )
-        page = context.new_page()
-        page.set_default_timeout(10000)  # 10s default
-        
-        try:
-            print(f"[Worker {worker_id}] Pages {start_page}-{end_page}")
+    return _worker_browser
+
+def release_claims(claimed, games, kept):
+    """Drop the claims on `games` this job did not keep, so a later page listing them still scrapes them."""
+    if claimed is None:
+        return
+    kept_ids = {id(g) for g in kept}
+    for game in games:
+        if id(game) not in kept_ids:
+            claimed.pop(game["url"], None)
+
+def scrape_page_range(worker_id, page_list, scrape_details=True, download_media_files=True, claimed=None):
+    """Scrape the given search pages - OPTIMIZED VERSION.
+    
+    worker_id only labels log lines; None uses this process's PID.
+    claimed is an optional dict shared between jobs (URL -> page number): a game
+    another page already claimed is dropped before its details are scraped."""
+    global _next_listing
+    local_data = []
+    if worker_id is None:
+        worker_id = os.getpid()
+    
+    browser = get_worker_browser()
+    context = browser.new_context(
+        viewport={'width': 1920, 'height': 1080},
+        user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        service_workers=SERVICE_WORKERS
+    )
+    context.route("**/*", block_steam_resources)
+    context.add_cookies(AGE_GATE_COOKIES)
+    page = context.new_page()
+    page.set_default_timeout(10000)  # 10s default
+    # Shared by every game in this job so downloads overlap with page scraping
+    download_pool = ThreadPoolExecutor(max_workers=MEDIA_DOWNLOAD_WORKERS)
+    
+    try:
+        print(f"[Worker {worker_id}] Pages {', '.join(map(str, page_list))}")
+        
+        for page_num in page_list:
+            # Rate limiting: listings start SEARCH_MIN_INTERVAL apart per process, and the
+            # time spent scraping the previous page's games already counts toward it
+            wait = _next_listing - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            _next_listing = time.monotonic() + SEARCH_MIN_INTERVAL
             
-            for page_num in range(start_page, end_page + 1):
+            page_games = []
+            try:
+                # Listing JSON first; the full search page only if that fails
                 try:
-                    # Navigate to search page
+                    rows = fetch_search_rows(page, page_num)
+                except Exception:
                     url = f"https://store.steampowered.com/search/?filter=topsellers&page={page_num}"
                     page.goto(url, wait_until="domcontentloaded", timeout=15000)
-                    
-                    # Wait for search results
                     page.wait_for_selector("#search_resultsRows", timeout=8000)
-                    time.sleep(0.3)  # Brief pause
                     
-                    # Get ALL game elements at once
-                    game_elements = page.locator("#search_resultsRows > a").all()
-                    
-                    # Process all games on this page
-                    page_games = []
-                    for idx, game_elem in enumerate(game_elements):
+                    # Read ALL result rows in a single evaluate
+                    rows = page.locator("#search_resultsRows > a").evaluate_all(SEARCH_ROWS_JS)
+                
+                # Process all games on this page
+                for row in rows:
+                    game_data = scrape_game_from_search(row)
+                    if game_data and game_data["url"] != "N/A":
+                        # Only the first page to list a game scrapes it
+                        if claimed is not None and claimed.setdefault(game_data["url"], page_num) != page_num:
+                            continue
+                        page_games.append(game_data)
+                
+                print(f"[Worker {worker_id}] Page {page_num}: Found {len(page_games)} games")
+                
+                # Now scrape details for each game
+                if scrape_details:
+                    page_details = fetch_page_details(page_games)
+                    pending_downloads = []
+                    for game_data in page_games:
                         try:
-                            game_data = scrape_game_from_search(game_elem)
-                            if game_data and game_data["url"] != "N/A":
-                                page_games.append(game_data)
-                        except:
+                            print(f"[Worker {worker_id}] {game_data['title'][:40]} (⭐{game_data['rating_score']})")
+                            api_details = page_details.get(app_id_from_url(game_data["url"]))
+                            details = scrape_game_details(page, game_data["url"], game_data["title"], False, api_details)
+                            game_data.update(details)
+                            
+                            # Filter: Only keep games with media
+                            if details["screenshots"] != "N/A" or details["videos"] != "N/A":
+                                local_data.append(game_data)
+                                # Downloads run while the next games are scraped
+                                if download_media_files:
+                                    pending_downloads.append(queue_media_downloads(game_data, game_data["title"], download_pool))
+                            else:
+                                print(f"[Worker {worker_id}] ⚠️ Skipped (no media)")
+                        except Exception as e:
+                            print(f"[Worker {worker_id}] Error: {str(e)[:40]}")
+                            if claimed is not None:
+                                claimed.pop(game_data["url"], None)
                             continue
                     
-                    print(f"[Worker {worker_id}] Page {page_num}: Found {len(page_games)} games")
-                    
-                    # Now scrape details for each game
-                    if scrape_details:
-                        for game_data in page_games:
-                            try:
-                                print(f"[Worker {worker_id}] {game_data['title'][:40]} (⭐{game_data['rating_score']})")
-                                details = scrape_game_details(page, game_data["url"], game_data["title"], download_media_files)
-                                game_data.update(details)
-                                
-                                # Filter: Only keep games with media
-                                if details["screenshots"] != "N/A" or details["videos"] != "N/A":
-                                    local_data.append(game_data)
-                                else:
-                                    print(f"[Worker {worker_id}] ⚠️ Skipped (no media)")
-                            except Exception as e:
-                                print(f"[Worker {worker_id}] Error: {str(e)[:40]}")
-                                continue
-                    else:
-                        local_data.extend(page_games)
-                    
-                    print(f"[Worker {worker_id}] Page {page_num} complete: {len(local_data)} total games")
-                    time.sleep(1)  # Rate limiting
-                    
-                except PlaywrightTimeout:
-                    print(f"[Worker {worker_id}] Timeout page {page_num}, skipping...")
-                    continue
-                except Exception as e:
-                    print(f"[Worker {worker_id}] Error page {page_num}: {str(e)[:50]}")
-                    continue
-            
-            print(f"[Worker {worker_id}] ✓ Complete: {len(local_data)} games")
-            
-        except Exception as e:
-            print(f"[Worker {worker_id}] Fatal: {str(e)[:60]}")
-        finally:
-            try:
-                context.close()
-                browser.close()
-            except:
-                pass
-    
-    with data_lock:
-        all_game_data.extend(local_data)
-    
+                    for finish in pending_downloads:
+                        finish()
+                else:
+                    local_data.extend(page_games)
+                
+                print(f"[Worker {worker_id}] Page {page_num} complete: {len(local_data)} total games")
+                
+            except PlaywrightTimeout:
+                print(f"[Worker {worker_id}] Timeout page {page_num}, skipping...")
+                release_claims(claimed, page_games, local_data)
+                continue
+            except Exception as e:
+                print(f"[Worker {worker_id}] Error page {page_num}: {str(e)[:50]}")
+                release_claims(claimed, page_games, local_data)
+                continue
+        
+        print(f"[Worker {worker_id}] ✓ Complete: {len(local_data)} games")
+        
+    except Exception as e:
+        print(f"[Worker {worker_id}] Fatal: {str(e)[:60]}")
+    finally:
+        download_pool.shutdown()
+        # Only the context goes; the browser stays up for this process's next job
+        try:
+            context.close()
+        except:
+            pass
+
     return local_data
 
-def scrape_steam_games(max_games=100, num_workers=5, scrape_details=True, download_media_files=True):
+def scrape_steam_games(max_games=100, num_workers=5, scrape_details=True, download_media_files=True, executor=None):
     """
-    Scrape Steam games using Playwright with multithreading - OPTIMIZED.
+    Scrape Steam games using Playwright with one process per worker - OPTIMIZED.
     
     Args:
         max_games: Target number of games to scrape
         num_workers: Number of parallel workers (recommended: 3-7)
         scrape_details: Whether to scrape detailed game info
         download_media_files: Whether to download media files
+        executor: Optional ProcessPoolExecutor shared across calls, so its
+            workers keep their browsers warm between scrapes
     """
-    global all_game_data
-    all_game_data = []
+    # Keyed by URL: duplicates across workers are dropped as results arrive
+    all_games = {}
+    received = 0
     
     # Optimize worker count
     num_workers = min(num_workers, 7)
@@ -615,71 +843,90 @@ def scrape_steam_games(max_games=100, num_workers=5, scrape_details=True, downlo
     
     games_per_page = 25
     total_pages_needed = (max_games + games_per_page - 1) // games_per_page
-    pages_per_worker = max(1, total_pages_needed // num_workers)
+    num_workers = min(num_workers, total_pages_needed)
+    
+    print(f"📄 Pages: {total_pages_needed} | Workers: {num_workers}\n")
     
-    print(f"📄 Pages: {total_pages_needed} | Per worker: {pages_per_worker}\n")
+    # Created once here; workers only add the per-game folder under MEDIA_ROOT
+    os.makedirs(MEDIA_ROOT, exist_ok=True)
+    output_file = os.path.join(OUTPUT_DIR, "steam_games_detailed.csv")
     
-    with ThreadPoolExecutor(max_workers=num_workers) as executor:
-        futures = []
-        for i in range(num_workers):
-            start_page = (i * pages_per_worker) + 1
-            end_page = start_page + pages_per_worker - 1
-            if i == num_workers - 1:
-                end_page = total_pages_needed
+    # Separate processes: each worker owns its browser and its own GIL
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=num_workers)
+    
+    # Rows are written as each page finishes, so an interrupted run keeps its data
+    with open(output_file, 'w', newline='', encoding='utf-8-sig') as f, multiprocessing.Manager() as manager:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS, extrasaction='ignore')
+        writer.writeheader()
+        try:
+            # Top sellers reorder while the pages are read, so one game can appear on two
+            # pages; the shared claims keep the second page from loading its store page again
+            claimed = manager.dict()
+            # One job per listing page: an idle process takes the next page, and each
+            # page's rows come straight back through its future
+            futures = [executor.submit(scrape_page_range, None, [page_num], scrape_details, download_media_files, claimed)
+                       for page_num in range(1, total_pages_needed + 1)]
             
-            future = executor.submit(scrape_page_range, i + 1, start_page, end_page, scrape_details, download_media_files)
-            futures.append(future)
-        
-        for future in as_completed(futures):
-            try:
-                future.result()
-            except Exception as e:
-                print(f"⚠️ Worker error: {str(e)[:60]}")
+            for future in as_completed(futures):
+                try:
+                    for game in future.result():
+                        received += 1
+                        if game["url"] not in all_games:
+                            all_games[game["url"]] = game
+                            writer.writerow(csv_row(game))
+                    f.flush()
+                except Exception as e:
+                    print(f"⚠️ Worker error: {str(e)[:60]}")
+        finally:
+            if own_executor:
+                executor.shutdown()
     
     elapsed = time.time() - start_time
     
+    all_game_data = list(all_games.values())
+    
     if all_game_data:
-        df = pd.DataFrame(all_game_data)
-        initial_count = len(df)
-        df = df.drop_duplicates(subset=['url'], keep='first')
-        
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        output_dir = os.path.join(script_dir, "scraped_data")
-        os.makedirs(output_dir, exist_ok=True)
-        output_file = os.path.join(output_dir, "steam_games_detailed.csv")
-        df.to_csv(output_file, index=False, encoding='utf-8-sig')
+        total = len(all_game_data)
+        count = lambda field, value: sum(1 for g in all_game_data if g.get(field) == value)
         
         print(f"\n{'='*70}")
-        print(f"✅ COMPLETE | {len(df)} games in {elapsed:.1f}s | ⚡{len(df)/elapsed:.2f} games/s")
-        if initial_count > len(df):
-            print(f"🗑️  Removed {initial_count - len(df)} duplicates")
+        print(f"✅ COMPLETE | {total} games in {elapsed:.1f}s | ⚡{total/elapsed:.2f} games/s")
+        if received > total:
+            print(f"🗑️  Removed {received - total} duplicates")
         print(f"💾 Saved: {output_file}")
         print(f"{'='*70}\n")
         
         # Show sample
-        display_cols = [col for col in ['title', 'price', 'rating_score', 'rating_percentage', 'genres'] if col in df.columns]
-        print(df[display_cols].head(10).to_string(index=False))
+        print(f"{'title':<40} {'price':>10} {'rating':>7} {'%':>4}  genres")
+        for g in all_game_data[:10]:
+            print(f"{g['title'][:40]:<40} {g['price'][:10]:>10} {str(g['rating_score'] or ''):>7} "
+                  f"{str(g['rating_percentage'] or ''):>4}  {g.get('genres', '')[:40]}")
         
         if scrape_details:
             print(f"\n📊 Statistics:")
             stats = {
-                "Single-player": len(df[df['singleplayer'] == 'Yes']),
-                "Multi-player": len(df[df['multiplayer'] == 'Yes']),
-                "Free games": len(df[df['price'] == 'Free']),
-                "On sale": len(df[df['discount_percentage'] != 'N/A']),
-                "With screenshots": len(df[df['screenshots'] != 'N/A']),
-                "With videos": len(df[df['videos'] != 'N/A'])
+                "Single-player": count('singleplayer', 'Yes'),
+                "Multi-player": count('multiplayer', 'Yes'),
+                "Free games": count('price', 'Free'),
+                "On sale": total - count('discount_percentage', 'N/A'),
+                "With screenshots": total - count('screenshots', 'N/A'),
+                "With videos": total - count('videos', 'N/A')
             }
+            if download_media_files:
+                stats["Images downloaded"] = sum(len(g.get('downloaded_images', ())) for g in all_game_data)
+                stats["Videos downloaded"] = sum(len(g.get('downloaded_videos', ())) for g in all_game_data)
             for key, val in stats.items():
                 print(f"   {key}: {val}")
             
-            rated_games = df[df['rating_score'].notna()]
-            if len(rated_games) > 0:
+            scores = [g['rating_score'] for g in all_game_data if g['rating_score'] is not None]
+            if scores:
                 print(f"\n⭐ Ratings:")
-                print(f"   Games rated: {len(rated_games)}")
-                print(f"   Average: {rated_games['rating_score'].mean():.1f}/100")
-                print(f"   Highest: {rated_games['rating_score'].max()}/100")
-                print(f"   Lowest: {rated_games['rating_score'].min()}/100")
+                print(f"   Games rated: {len(scores)}")
+                print(f"   Average: {sum(scores) / len(scores):.1f}/100")
+                print(f"   Highest: {max(scores)}/100")
+                print(f"   Lowest: {min(scores)}/100")
     else:
         print("❌ No games scraped")
     